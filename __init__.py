@@ -31,6 +31,7 @@ if 'PYTEST_CURRENT_TEST' not in os.environ:
 
     # Setup custom server routes for save functionality
     try:
+        import asyncio
         from aiohttp import web
         from server import PromptServer
         import folder_paths
@@ -144,6 +145,9 @@ if 'PYTEST_CURRENT_TEST' not in os.environ:
                         "error": f"Mesh not found in cache: {mesh_id}"
                     }, status=404)
 
+                # Wait for the preview's initial background export before touching the mesh
+                await asyncio.get_running_loop().run_in_executor(None, cache_entry['ready'].wait)
+
                 mesh = cache_entry['mesh']
                 filename = cache_entry['filename']
 
@@ -152,13 +156,13 @@ if 'PYTEST_CURRENT_TEST' not in os.environ:
                 count = 0
 
                 if analysis_type == "open_edges":
-                    mesh, count = compute_boundary_vertices(mesh)
+                    mesh, count = compute_boundary_vertices(mesh, mesh_id)
                     field_name = "boundary_vertex"
                 elif analysis_type == "components":
-                    mesh, count = compute_connected_components(mesh)
+                    mesh, count = compute_connected_components(mesh, mesh_id)
                     field_name = "face.part_id"
                 elif analysis_type == "self_intersect":
-                    mesh, count = compute_self_intersections(mesh)
+                    mesh, count = compute_self_intersections(mesh, mesh_id)
                     field_name = "face.self_intersect"
                 else:
                     return web.json_response({
@@ -193,6 +197,68 @@ if 'PYTEST_CURRENT_TEST' not in os.environ:
                     "error": str(e)
                 }, status=500)
 
+        @routes.get("/geompack/mesh_ready")
+        async def mesh_ready(request):
+            """
+            Check whether the analysis preview file for a cached mesh has been written.
+
+            Query params:
+                mesh_id: "abc123def456"
+
+            Response JSON:
+                {
+                    "success": true,
+                    "ready": true,
+                    "filename": "analysis_abc123def456.vtp"
+                }
+            """
+            from .nodes.visualization.preview_mesh_analysis import get_cached_mesh
+
+            mesh_id = request.query.get("mesh_id")
+            cache_entry = get_cached_mesh(mesh_id) if mesh_id else None
+            if not cache_entry:
+                return web.json_response({
+                    "success": False,
+                    "error": f"Mesh not found in cache: {mesh_id}"
+                }, status=404)
+
+            return web.json_response({
+                "success": True,
+                "ready": cache_entry['ready'].is_set(),
+                "filename": cache_entry['filename']
+            })
+
+        @routes.get("/geompack/preview_ready")
+        async def preview_ready(request):
+            """
+            Check whether a background Preview Mesh export has finished writing.
+
+            Query params:
+                filename: "preview_vtk_abc123de.vtp"
+
+            Response JSON:
+                {
+                    "success": true,
+                    "ready": true,
+                    "filename": "preview_vtk_abc123de.vtp"
+                }
+            """
+            from .nodes.visualization.preview_mesh_vtk import get_pending_export
+
+            filename = request.query.get("filename")
+            export_entry = get_pending_export(filename) if filename else None
+            if not export_entry:
+                return web.json_response({
+                    "success": False,
+                    "error": f"No pending export for: {filename}"
+                }, status=404)
+
+            return web.json_response({
+                "success": True,
+                "ready": export_entry['ready'].is_set(),
+                "filename": export_entry['filename']
+            })
+
         @routes.post("/geompack/find_location")
         async def find_location(request):
             """
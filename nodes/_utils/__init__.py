@@ -7,8 +7,13 @@ This package contains shared utility functions used across multiple nodes.
 These are internal implementation details and should not be imported directly by users.
 """
 
+import os
+
 # Re-export commonly used utilities for convenience
 from .mesh_ops import *
 from .blender_bridge import *
 
-__all__ = ['mesh_ops', 'blender_bridge']
+# Per-preview diagnostics are only printed when GEOMPACK_VERBOSE is set
+VERBOSE = bool(os.environ.get("GEOMPACK_VERBOSE", ""))
+
+__all__ = ['mesh_ops', 'blender_bridge', 'VERBOSE']
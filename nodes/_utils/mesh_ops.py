@@ -87,6 +87,64 @@ def get_geometry_type(mesh) -> str:
     return "Point Cloud" if is_point_cloud(mesh) else "Mesh"
 
 
+def classify_mesh(mesh) -> Tuple[str, int, bool]:
+    """
+    Get the geometry type, face count and point-cloud flag in one pass.
+
+    Equivalent to calling get_geometry_type, get_face_count and is_point_cloud
+    separately, but only walks the faces attribute once.
+
+    Args:
+        mesh: trimesh.Trimesh or trimesh.PointCloud object
+
+    Returns:
+        Tuple of (geometry type string, face count, is point cloud)
+    """
+    face_count = get_face_count(mesh)
+    is_pc = face_count == 0
+    return ("Point Cloud" if is_pc else "Mesh"), face_count, is_pc
+
+
+def get_bounds(mesh) -> np.ndarray:
+    """
+    Get the axis-aligned bounds of a mesh or point cloud.
+
+    Uses trimesh's cached bounds for meshes and a single min/max pass
+    over the vertices for point clouds.
+
+    Args:
+        mesh: trimesh.Trimesh or trimesh.PointCloud object
+
+    Returns:
+        (2, 3) array of [min, max] corners
+    """
+    bounds = None if is_point_cloud(mesh) else mesh.bounds
+    if bounds is None:
+        vertices = np.asarray(mesh.vertices)
+        bounds = np.vstack((vertices.min(axis=0), vertices.max(axis=0)))
+    return bounds
+
+
+def as_contiguous(array, dtype) -> np.ndarray:
+    """
+    View an array as a C-contiguous ndarray of the given dtype, copying only if needed.
+
+    Useful before handing trimesh arrays to native bindings (PyMeshLab,
+    pymeshfix, libigl) so that already-compatible data is passed through.
+
+    Args:
+        array: Array-like input (e.g. trimesh TrackedArray)
+        dtype: Required numpy dtype
+
+    Returns:
+        The input data as a plain ndarray (no copy when dtype/layout already match)
+    """
+    array = np.asarray(array)
+    if array.dtype == dtype and array.flags.c_contiguous:
+        return array
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
 def _load_vtk_mesh(file_path: str) -> Tuple[Optional[trimesh.Trimesh], str]:
     """
     Load VTK format files (VTP, VTU, VTK) using pyvista.
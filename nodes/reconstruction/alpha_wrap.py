@@ -11,6 +11,8 @@ Useful for point clouds, non-manifold meshes, or polygon soups.
 import numpy as np
 import trimesh
 
+from .._utils import mesh_ops
+
 
 class AlphaWrapNode:
     """
@@ -81,8 +83,8 @@ class AlphaWrapNode:
                 "Install with: pip install pymeshlab"
             )
 
-        # Get input stats
-        vertices = np.asarray(input_mesh.vertices, dtype=np.float64)
+        # Get input stats (vertices are passed to PyMeshLab without a copy when possible)
+        vertices = mesh_ops.as_contiguous(input_mesh.vertices, np.float64)
         input_vertex_count = len(vertices)
 
         # Check if input is point cloud or mesh
@@ -102,10 +104,8 @@ class AlphaWrapNode:
         input_face_count = len(input_mesh.faces)
         input_type = "mesh"
 
-        # Compute bounding box diagonal for relative parameters
-        bbox_min = vertices.min(axis=0)
-        bbox_max = vertices.max(axis=0)
-        bbox_diagonal = np.linalg.norm(bbox_max - bbox_min)
+        # Compute bounding box diagonal for relative parameters (extents are cached by trimesh)
+        bbox_diagonal = np.linalg.norm(input_mesh.extents)
 
         # Convert percentages to absolute values
         alpha = (alpha_percent / 100.0) * bbox_diagonal
@@ -122,7 +122,15 @@ class AlphaWrapNode:
         ms = pymeshlab.MeshSet()
 
         # Add mesh to MeshSet
-        faces = np.asarray(input_mesh.faces, dtype=np.int32)
+        faces = mesh_ops.as_contiguous(input_mesh.faces, np.int32)
+
+        # Merge duplicate vertex positions (common in triangle soups) to shrink the wrap input
+        unique_idx, inverse = trimesh.grouping.unique_rows(vertices)
+        if len(unique_idx) < len(vertices):
+            print(f"[AlphaWrap] Merged {len(vertices) - len(unique_idx):,} duplicate vertices")
+            vertices = vertices[unique_idx]
+            faces = inverse[faces].astype(np.int32)
+
         pml_mesh = pymeshlab.Mesh(
             vertex_matrix=vertices,
             face_matrix=faces
@@ -136,7 +144,7 @@ class AlphaWrapNode:
             offset=pymeshlab.PureValue(offset)
         )
 
-        # Get result
+        # Get result (vertex_matrix/face_matrix return fresh arrays we can hand straight to trimesh)
         result_pml = ms.current_mesh()
         result_vertices = result_pml.vertex_matrix()
         result_faces = result_pml.face_matrix()
@@ -145,7 +153,8 @@ class AlphaWrapNode:
         result_mesh = trimesh.Trimesh(
             vertices=result_vertices,
             faces=result_faces,
-            process=False
+            process=False,
+            validate=False
         )
 
         # Copy metadata if present
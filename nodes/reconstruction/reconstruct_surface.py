@@ -359,7 +359,7 @@ Ball pivoting preserves fine details but may have holes.
 
         if alpha_value == 0.0:
             # Auto alpha: use 10% of bounding box diagonal
-            bbox_diag = np.linalg.norm(vertices.max(axis=0) - vertices.min(axis=0))
+            bbox_diag = np.linalg.norm(np.ptp(vertices, axis=0))
             alpha_value = bbox_diag * 0.1
             print(f"[Reconstruct] Auto alpha: {alpha_value:.4f}")
 
@@ -14,47 +14,103 @@ try:
 except ImportError:
     HAS_IGL = False
 
+# Normal assigned by igl.per_face_normals to degenerate faces
+_IGL_DEGEN_REF = np.array([1.0, 1.0, 1.0], dtype=np.float64)
 
-def _orient_outward_winding(V, F, face_normals):
+
+def _centroids(V, F, out=None):
+    """Face centroids (M, 3) as a single gather + mean reduction, optionally into `out`."""
+    return np.mean(V[F], axis=1, out=out)
+
+
+def _flip_rows(F, flip_mask):
+    """Reverse the winding of the masked rows of F in place (swap columns 1 and 2)."""
+    col1 = F[flip_mask, 1]
+    F[flip_mask, 1] = F[flip_mask, 2]
+    F[flip_mask, 2] = col1
+    return F
+
+
+def _build_aabb(V, F):
+    """Build an igl.AABB tree over (V, F), or None if the bindings lack it."""
+    if not hasattr(igl, "AABB"):
+        return None
+    tree = igl.AABB()
+    tree.init(V, F)
+    return tree
+
+
+def _orient_bfs(V, F, face_normals, bbox_diag, aabb=None, centroid_buf=None):
+    """
+    Use BFS over face adjacency to make orientation consistent per component.
+
+    Does not decide inside/outside; each component keeps the orientation
+    of its seed face. Only F is used, the other arguments keep the helper
+    signature uniform.
+
+    Returns:
+        tuple: (F_out, num_flipped, num_components)
+    """
+    FF, C = igl.bfs_orient(F)
+    return FF, None, len(np.unique(C))
+
+
+def _orient_outward_winding(V, F, face_normals, bbox_diag, aabb=None, centroid_buf=None):
     """
     Use fast winding number to orient faces outward.
 
-    For each face, query winding number at a point offset slightly along
-    the negative normal. If winding > 0.5, point is inside mesh = normal
-    points outward (correct). If winding < 0.5, normal points inward (flip).
+    First makes every connected component internally consistent with
+    igl.bfs_orient, then queries the winding number at a single point per
+    component (just behind its largest face). If winding < 0.5, that point
+    is outside the mesh, so the whole component points inward (flip).
 
     Args:
         V: Vertices array (N, 3)
         F: Faces array (M, 3)
         face_normals: Face normals array (M, 3)
+        bbox_diag: Bounding box diagonal of V
+        aabb: Unused (uniform helper signature)
+        centroid_buf: Unused (only a few representative centroids are needed)
 
     Returns:
-        tuple: (F_out, flip_mask, num_flipped)
+        tuple: (F_out, num_flipped, num_components)
     """
-    # Compute face centroids
-    face_centroids = (V[F[:, 0]] + V[F[:, 1]] + V[F[:, 2]]) / 3.0
+    # Consistent orientation within each component (flips rows in reverse)
+    FF, C = igl.bfs_orient(F)
+    bfs_flipped = ~np.all(FF == F, axis=1)
+
+    # Pick the largest face of each component as its representative
+    double_area = igl.doublearea(V, F).ravel()
+    order = np.lexsort((-double_area, C))
+    C_sorted = C[order]
+    first = np.flatnonzero(np.r_[True, C_sorted[1:] != C_sorted[:-1]])
+    reps = order[first]
+    rep_labels = C_sorted[first]
+
+    # Representative normals in their BFS orientation
+    rep_normals = np.where(bfs_flipped[reps, None], -face_normals[reps], face_normals[reps])
+    rep_centroids = _centroids(V, F[reps])
 
     # Adaptive epsilon based on mesh scale
-    bbox_diag = np.linalg.norm(V.max(axis=0) - V.min(axis=0))
     eps = 1e-4 * bbox_diag
 
-    # Query points offset slightly inside (along -normal direction)
-    query_inside = face_centroids - face_normals * eps
+    # One winding number query per component instead of per face
+    W = igl.fast_winding_number(V, FF, rep_centroids - rep_normals * eps)
 
-    # Compute winding numbers
-    W = igl.fast_winding_number(V, F, query_inside)
+    component_flip = np.zeros(C.max() + 1, dtype=bool)
+    component_flip[rep_labels] = W < 0.5
+    comp_mask = component_flip[C]
 
-    # If winding < 0.5, the query point is outside, meaning normal points inward
-    flip_mask = W < 0.5
+    # Flip inward-facing components by reversing vertex order
+    F_out = _flip_rows(FF, comp_mask)
 
-    # Flip faces by reversing vertex order
-    F_out = F.copy()
-    F_out[flip_mask] = F_out[flip_mask][:, [0, 2, 1]]
+    # Faces whose final orientation differs from the input
+    flip_mask = bfs_flipped ^ comp_mask
 
-    return F_out, flip_mask, np.sum(flip_mask)
+    return F_out, int(np.count_nonzero(flip_mask)), len(rep_labels)
 
 
-def _orient_outward_raycast(V, F, face_normals):
+def _orient_outward_raycast(V, F, face_normals, bbox_diag, aabb=None, centroid_buf=None):
     """
     Use ray-mesh intersection to orient faces outward (odd/even test).
 
@@ -65,80 +121,94 @@ def _orient_outward_raycast(V, F, face_normals):
         V: Vertices array (N, 3)
         F: Faces array (M, 3)
         face_normals: Face normals array (M, 3)
+        bbox_diag: Bounding box diagonal of V
+        aabb: Optional prebuilt igl.AABB over (V, F); built here if None
+        centroid_buf: Optional (M, 3) float64 buffer for the face centroids
 
     Returns:
-        tuple: (F_out, flip_mask, num_flipped)
+        tuple: (F_out, num_flipped, num_components)
     """
     # Compute face centroids
-    face_centroids = (V[F[:, 0]] + V[F[:, 1]] + V[F[:, 2]]) / 3.0
+    face_centroids = _centroids(V, F, out=centroid_buf)
 
     # Small offset to avoid self-intersection
-    eps = 1e-6
+    eps = 1e-6 * bbox_diag
 
-    flip_mask = np.zeros(len(F), dtype=bool)
+    origins = np.ascontiguousarray(face_centroids + face_normals * eps)
+    directions = np.ascontiguousarray(face_normals, dtype=np.float64)
 
-    for i in range(len(F)):
-        origin = face_centroids[i] + face_normals[i] * eps
-        direction = face_normals[i]
+    if aabb is None:
+        aabb = _build_aabb(V, F)
 
-        # Cast ray and get hits
-        hits = igl.ray_mesh_intersect(
-            np.ascontiguousarray(origin, dtype=np.float64),
-            np.ascontiguousarray(direction, dtype=np.float64),
-            V, F
-        )
+    if aabb is not None:
+        # Trace all rays in one call against a single BVH
+        hits = aabb.intersect_ray(V, F, origins, directions)
+        hit_counts = np.fromiter((len(h) for h in hits), dtype=np.int64, count=len(F))
+    else:
+        # Older bindings: one ray at a time
+        hit_counts = np.zeros(len(F), dtype=np.int64)
+        for i in range(len(F)):
+            hits = igl.ray_mesh_intersect(origins[i], directions[i], V, F)
+            if hits is not None:
+                hit_counts[i] = len(hits)
 
-        # Odd number of hits = pointing inward
-        if hits is not None and len(hits) % 2 == 1:
-            flip_mask[i] = True
+    # Odd number of hits = pointing inward
+    flip_mask = hit_counts % 2 == 1
 
     # Flip faces by reversing vertex order
-    F_out = F.copy()
-    F_out[flip_mask] = F_out[flip_mask][:, [0, 2, 1]]
+    F_out = _flip_rows(F.copy(), flip_mask)
 
-    return F_out, flip_mask, np.sum(flip_mask)
+    return F_out, int(np.count_nonzero(flip_mask)), None
 
 
-def _orient_outward_signed_dist(V, F, face_normals):
+def _orient_outward_signed_dist(V, F, face_normals, bbox_diag, aabb=None, centroid_buf=None):
     """
-    Use signed distance to orient faces outward.
+    Use the sign of the distance field to orient faces outward.
 
-    Query signed distance at points offset along normal direction.
-    Positive distance = inside surface = flip needed.
+    Query points are offset along the normal direction. The sign of the
+    distance only depends on whether a point is inside the surface, so it
+    is read from the fast winding number (no closest-point queries).
+    Inside (|winding| > 0.5) = normal points inward = flip needed.
 
     Args:
         V: Vertices array (N, 3)
         F: Faces array (M, 3)
         face_normals: Face normals array (M, 3)
+        bbox_diag: Bounding box diagonal of V
+        aabb: Unused (uniform helper signature)
+        centroid_buf: Optional (M, 3) float64 buffer for the face centroids
 
     Returns:
-        tuple: (F_out, flip_mask, num_flipped)
+        tuple: (F_out, num_flipped, num_components)
     """
     # Compute face centroids
-    face_centroids = (V[F[:, 0]] + V[F[:, 1]] + V[F[:, 2]]) / 3.0
+    face_centroids = _centroids(V, F, out=centroid_buf)
 
     # Adaptive epsilon based on mesh scale
-    bbox_diag = np.linalg.norm(V.max(axis=0) - V.min(axis=0))
     eps = 1e-4 * bbox_diag
 
     # Query points offset along normal direction (outside if normal correct)
     query_points = face_centroids + face_normals * eps
 
-    # Compute signed distance using pseudonormal method
-    S, I, C, N = igl.signed_distance(
-        np.ascontiguousarray(query_points, dtype=np.float64),
-        V, F,
-        igl.SIGNED_DISTANCE_TYPE_PSEUDONORMAL
-    )
+    # Inside/outside classification only needs the winding number
+    W = igl.fast_winding_number(V, F, query_points)
 
-    # Positive signed distance = inside mesh = normal points inward
-    flip_mask = S > 0
+    # Inside mesh = normal points inward (abs: inverted parts wind negatively)
+    flip_mask = np.abs(W) > 0.5
 
     # Flip faces by reversing vertex order
-    F_out = F.copy()
-    F_out[flip_mask] = F_out[flip_mask][:, [0, 2, 1]]
+    F_out = _flip_rows(F.copy(), flip_mask)
+
+    return F_out, int(np.count_nonzero(flip_mask)), None
 
-    return F_out, flip_mask, np.sum(flip_mask)
+
+# igl method -> (helper, note appended to the info string)
+_METHODS = {
+    "igl_bfs": (_orient_bfs, "BFS makes faces consistent but doesn't determine inside/outside"),
+    "igl_winding": (_orient_outward_winding, "Winding number works best on closed/watertight meshes"),
+    "igl_raycast": (_orient_outward_raycast, "Raycasting works best on closed meshes without self-intersections"),
+    "igl_signed_dist": (_orient_outward_signed_dist, "Signed distance works best on watertight meshes"),
+}
 
 
 class FixNormalsNode:
@@ -157,7 +227,7 @@ class FixNormalsNode:
         # - igl_bfs: BFS-based consistent orientation (best for thin/open surfaces)
         # - igl_winding: Fast winding number (best for closed volumes)
         # - igl_raycast: Ray-mesh intersection odd/even test (closed volumes)
-        # - igl_signed_dist: Signed distance pseudonormal (closed volumes)
+        # - igl_signed_dist: Signed distance sign test (closed volumes)
         return {
             "required": {
                 "trimesh": ("TRIMESH",),
@@ -170,6 +240,10 @@ class FixNormalsNode:
     FUNCTION = "fix_normals"
     CATEGORY = "geompack/repair"
 
+    def __init__(self):
+        # Face centroid scratch buffer, reused across executions of this node
+        self._centroid_buf = None
+
     def fix_normals(self, trimesh, method="trimesh"):
         """
         Fix inconsistent face normal orientations.
@@ -183,7 +257,7 @@ class FixNormalsNode:
             - igl_bfs: BFS-based consistent orientation (best for thin/open surfaces)
             - igl_winding: Fast winding number outward orientation (closed volumes)
             - igl_raycast: Ray-mesh intersection odd/even test (closed volumes)
-            - igl_signed_dist: Signed distance pseudonormal (closed volumes)
+            - igl_signed_dist: Signed distance sign test (closed volumes)
 
         Returns:
             tuple: (fixed_trimesh, info_string)
@@ -203,72 +277,42 @@ class FixNormalsNode:
         extra_info = ""
 
         # Check if igl is required but not available
-        igl_methods = ["igl_bfs", "igl_winding", "igl_raycast", "igl_signed_dist"]
-        if method in igl_methods and not HAS_IGL:
+        if method in _METHODS and not HAS_IGL:
             print(f"[FixNormals] igl not available, falling back to trimesh method")
             fixed_mesh.fix_normals()
             method_used = "trimesh (fallback - igl not available)"
 
-        elif method == "igl_bfs":
-            # Use libigl's BFS-based orientation (best for thin/open surfaces)
-            V = np.asarray(fixed_mesh.vertices, dtype=np.float64)
-            F = np.asarray(fixed_mesh.faces, dtype=np.int64)
-
-            # Orient faces using BFS
-            FF, C = igl.bfs_orient(F)
-
-            # Update mesh faces with oriented version
-            fixed_mesh.faces = FF
-
-            # Track number of orientation components
-            num_components = len(np.unique(C))
-            print(f"[FixNormals] igl.bfs_orient: {num_components} orientation components")
-            extra_info = "\nNote: BFS makes faces consistent but doesn't determine inside/outside"
-
-        elif method == "igl_winding":
-            # Use fast winding number to orient outward (best for closed volumes)
-            V = np.asarray(fixed_mesh.vertices, dtype=np.float64)
-            F = np.asarray(fixed_mesh.faces, dtype=np.int64)
-
-            # Compute face normals first
-            face_normals = igl.per_face_normals(V, F, np.array([1., 1., 1.]))
-
-            # Orient faces outward using winding number
-            FF, flip_mask, num_flipped = _orient_outward_winding(V, F, face_normals)
-            fixed_mesh.faces = FF
-
-            print(f"[FixNormals] igl_winding: flipped {num_flipped}/{len(F)} faces")
-            extra_info = "\nNote: Winding number works best on closed/watertight meshes"
-
-        elif method == "igl_raycast":
-            # Use ray-mesh intersection odd/even test
-            V = np.asarray(fixed_mesh.vertices, dtype=np.float64)
-            F = np.asarray(fixed_mesh.faces, dtype=np.int64)
-
-            # Compute face normals first
-            face_normals = igl.per_face_normals(V, F, np.array([1., 1., 1.]))
-
-            # Orient faces outward using raycasting
-            FF, flip_mask, num_flipped = _orient_outward_raycast(V, F, face_normals)
-            fixed_mesh.faces = FF
-
-            print(f"[FixNormals] igl_raycast: flipped {num_flipped}/{len(F)} faces")
-            extra_info = "\nNote: Raycasting works best on closed meshes without self-intersections"
-
-        elif method == "igl_signed_dist":
-            # Use signed distance with pseudonormal
-            V = np.asarray(fixed_mesh.vertices, dtype=np.float64)
-            F = np.asarray(fixed_mesh.faces, dtype=np.int64)
-
-            # Compute face normals first
-            face_normals = igl.per_face_normals(V, F, np.array([1., 1., 1.]))
-
-            # Orient faces outward using signed distance
-            FF, flip_mask, num_flipped = _orient_outward_signed_dist(V, F, face_normals)
+        elif method in _METHODS:
+            orient, note = _METHODS[method]
+
+            # Shared inputs, computed once for whichever igl method runs
+            V = np.ascontiguousarray(fixed_mesh.vertices, dtype=np.float64)
+            F = np.ascontiguousarray(fixed_mesh.faces, dtype=np.int64)
+            face_normals = bbox_diag = aabb = None
+            if method != "igl_bfs":
+                bbox_diag = np.linalg.norm(np.ptp(V, axis=0))
+                face_normals = igl.per_face_normals(V, F, _IGL_DEGEN_REF)
+            if method == "igl_raycast":
+                # BVH for ray queries, built once and shared with the helper
+                aabb = _build_aabb(V, F)
+
+            # Only the raycast and signed-distance helpers need per-face centroids
+            centroid_buf = None
+            if method in ("igl_raycast", "igl_signed_dist"):
+                if self._centroid_buf is None or len(self._centroid_buf) < len(F):
+                    self._centroid_buf = np.empty((len(F), 3), dtype=np.float64)
+                centroid_buf = self._centroid_buf[:len(F)]
+
+            FF, num_flipped, num_components = orient(
+                V, F, face_normals, bbox_diag, aabb, centroid_buf=centroid_buf
+            )
             fixed_mesh.faces = FF
 
-            print(f"[FixNormals] igl_signed_dist: flipped {num_flipped}/{len(F)} faces")
-            extra_info = "\nNote: Signed distance works best on watertight meshes"
+            if num_components is not None:
+                print(f"[FixNormals] {method}: {num_components} orientation components")
+            if num_flipped is not None:
+                print(f"[FixNormals] {method}: flipped {num_flipped}/{len(F)} faces")
+            extra_info = f"\nNote: {note}"
 
         else:
             # Use trimesh's built-in method
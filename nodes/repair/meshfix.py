@@ -12,6 +12,8 @@ import numpy as np
 import trimesh
 import pymeshfix
 
+from .._utils import mesh_ops
+
 
 class MeshFixNode:
     """
@@ -130,60 +132,79 @@ class MeshFixNode:
         initial_faces = len(input_mesh.faces)
         was_watertight = input_mesh.is_watertight
 
-        # Convert to numpy arrays
-        v = np.asarray(input_mesh.vertices, dtype=np.float64)
-        f = np.asarray(input_mesh.faces, dtype=np.int32)
-
-        # Create PyTMesh instance
-        tin = pymeshfix.PyTMesh()
-        tin.load_array(v, f)
+        # Convert to the float64/int32 C-contiguous arrays pymeshfix expects (no copy if already matching)
+        v = mesh_ops.as_contiguous(input_mesh.vertices, np.float64)
+        f = mesh_ops.as_contiguous(input_mesh.faces, np.int32)
 
-        # Track operations
-        operations = []
+        # Default settings match MeshFix's own Clean() pipeline, which pymeshfix
+        # runs in a single native call
+        standard_pipeline = (
+            not join_components and fill_holes and max_hole_edges == 0 and refine_holes
+            and clean_mesh and clean_iterations == 10 and inner_loops == 3
+        )
 
-        # Get initial boundary count
-        try:
-            initial_boundaries = tin.boundaries()
-        except:
+        if standard_pipeline:
+            print("[MeshFix] Running standard MeshFix pipeline...")
+            vclean, fclean = pymeshfix.clean_from_arrays(
+                v, f, remove_smallest_components=remove_small_components
+            )
+            operations = ["Removed small components"] if remove_small_components else []
+            operations += ["Filled holes (max_edges=all)", f"Cleaned (iters={clean_iterations})"]
             initial_boundaries = -1
-
-        # Apply repairs in order
-        if remove_small_components:
-            print("[MeshFix] Removing small components...")
-            tin.remove_smallest_components()
-            operations.append("Removed small components")
-
-        if join_components:
-            print("[MeshFix] Joining nearby components...")
-            tin.join_closest_components()
-            operations.append("Joined nearby components")
-
-        if fill_holes:
-            # 0 means fill all holes - use large number since pymeshfix requires int
-            nbe = max_hole_edges if max_hole_edges > 0 else 100000
-            print(f"[MeshFix] Filling holes (max_edges={nbe}, refine={refine_holes})...")
-            tin.fill_small_boundaries(nbe=nbe, refine=refine_holes)
-            operations.append(f"Filled holes (max_edges={'all' if max_hole_edges == 0 else nbe})")
-
-        if clean_mesh:
-            print(f"[MeshFix] Cleaning mesh (iterations={clean_iterations}, inner_loops={inner_loops})...")
-            tin.clean(max_iters=clean_iterations, inner_loops=inner_loops)
-            operations.append(f"Cleaned (iters={clean_iterations})")
-
-        # Get final boundary count
-        try:
-            final_boundaries = tin.boundaries()
-        except:
             final_boundaries = -1
 
-        # Extract result
-        vclean, fclean = tin.return_arrays()
+        else:
+            # Create PyTMesh instance
+            tin = pymeshfix.PyTMesh()
+            tin.load_array(v, f)
+
+            # Track operations
+            operations = []
+
+            # Get initial boundary count
+            try:
+                initial_boundaries = tin.boundaries()
+            except:
+                initial_boundaries = -1
+
+            # Apply repairs in order
+            if remove_small_components:
+                print("[MeshFix] Removing small components...")
+                tin.remove_smallest_components()
+                operations.append("Removed small components")
+
+            if join_components:
+                print("[MeshFix] Joining nearby components...")
+                tin.join_closest_components()
+                operations.append("Joined nearby components")
+
+            if fill_holes:
+                # 0 means fill all holes - use large number since pymeshfix requires int
+                nbe = max_hole_edges if max_hole_edges > 0 else 100000
+                print(f"[MeshFix] Filling holes (max_edges={nbe}, refine={refine_holes})...")
+                tin.fill_small_boundaries(nbe=nbe, refine=refine_holes)
+                operations.append(f"Filled holes (max_edges={'all' if max_hole_edges == 0 else nbe})")
+
+            if clean_mesh:
+                print(f"[MeshFix] Cleaning mesh (iterations={clean_iterations}, inner_loops={inner_loops})...")
+                tin.clean(max_iters=clean_iterations, inner_loops=inner_loops)
+                operations.append(f"Cleaned (iters={clean_iterations})")
+
+            # Get final boundary count
+            try:
+                final_boundaries = tin.boundaries()
+            except:
+                final_boundaries = -1
+
+            # Extract result
+            vclean, fclean = tin.return_arrays()
 
         # Create result mesh
         result_mesh = trimesh.Trimesh(
             vertices=vclean,
             faces=fclean,
-            process=False
+            process=False,
+            validate=False
         )
 
         # Copy metadata if present
@@ -13,6 +13,7 @@ Supports both meshes (with faces) and point clouds (without faces).
 import numpy as np
 import trimesh as trimesh_module
 import xml.etree.ElementTree as ET
+import zlib
 import sys
 import os
 
@@ -21,6 +22,41 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from _utils.mesh_ops import is_point_cloud, get_face_count
 
 
+# Uncompressed size of each zlib block in the appended data section
+_ZLIB_BLOCK_SIZE = 1 << 20
+
+
+class _AppendedData:
+    """
+    Accumulates zlib-compressed arrays for the raw <AppendedData> section of a VTK XML file.
+
+    Each array is stored in VTK's compressed layout: a UInt32 header
+    [num_blocks, block_size, last_block_size, compressed_size_1, ...]
+    followed by the compressed blocks.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0
+
+    def add_array(self, parent, values, vtk_type, dtype, **attributes):
+        """Add a DataArray element to parent whose data lives in the appended section."""
+        ET.SubElement(parent, 'DataArray', type=vtk_type, format='appended',
+                      offset=str(self.offset), **attributes)
+
+        raw = np.ascontiguousarray(values, dtype=dtype).tobytes()
+        blocks = [zlib.compress(raw[i:i + _ZLIB_BLOCK_SIZE], 1)
+                  for i in range(0, len(raw), _ZLIB_BLOCK_SIZE)]
+        header = np.array(
+            [len(blocks), _ZLIB_BLOCK_SIZE, len(raw) % _ZLIB_BLOCK_SIZE] + [len(b) for b in blocks],
+            dtype='<u4'
+        ).tobytes()
+
+        self.chunks.append(header)
+        self.chunks.extend(blocks)
+        self.offset += len(header) + sum(len(b) for b in blocks)
+
+
 def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str):
     """
     Export trimesh to VTK PolyData XML format (.vtp) with scalar attributes.
@@ -28,6 +64,9 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
     VTP format preserves vertex attributes (PointData) and face attributes (CellData)
     which can be visualized in VTK.js with color mapping.
 
+    Array data is written as zlib-compressed binary in a raw appended section,
+    which both VTK and VTK.js read natively and is far smaller than ASCII.
+
     Supports both meshes (with faces) and point clouds (without faces).
     For point clouds, uses Verts section instead of Polys section.
 
@@ -41,8 +80,10 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
     print(f"[_export_mesh_with_scalars_vtp] Exporting {geometry_type} to VTP: {filepath}")
 
     # Create VTK PolyData XML structure
-    vtk_file = ET.Element('VTKFile', type='PolyData', version='1.0', byte_order='LittleEndian')
+    vtk_file = ET.Element('VTKFile', type='PolyData', version='1.0', byte_order='LittleEndian',
+                          header_type='UInt32', compressor='vtkZLibDataCompressor')
     poly_data = ET.SubElement(vtk_file, 'PolyData')
+    appended = _AppendedData()
 
     num_verts = len(trimesh.vertices)
     num_faces = get_face_count(trimesh)
@@ -60,13 +101,7 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
 
     # Points section
     points = ET.SubElement(piece, 'Points')
-    points_data_array = ET.SubElement(points, 'DataArray',
-                                       type='Float32',
-                                       NumberOfComponents='3',
-                                       format='ascii')
-    # Flatten vertices to space-separated string
-    verts_flat = trimesh.vertices.flatten()
-    points_data_array.text = ' '.join(map(str, verts_flat))
+    appended.add_array(points, trimesh.vertices, 'Float32', '<f4', NumberOfComponents='3')
 
     # PointData section (scalar fields)
     point_data = ET.SubElement(piece, 'PointData')
@@ -75,11 +110,7 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
     if hasattr(trimesh, 'vertex_attributes') and trimesh.vertex_attributes:
         for attr_name, attr_values in trimesh.vertex_attributes.items():
             print(f"[_export_mesh_with_scalars_vtp]   Adding scalar field: {attr_name}")
-            scalar_array = ET.SubElement(point_data, 'DataArray',
-                                          type='Float32',
-                                          Name=attr_name,
-                                          format='ascii')
-            scalar_array.text = ' '.join(map(str, attr_values.flatten()))
+            appended.add_array(point_data, attr_values, 'Float32', '<f4', Name=attr_name)
 
     # CellData section (face attributes) - only for meshes with faces
     if not is_pc:
@@ -95,12 +126,8 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
                     continue
                 print(f"[_export_mesh_with_scalars_vtp]   Adding face field: {attr_name}")
                 num_components = attr_arr.shape[1] if attr_arr.ndim > 1 else 1
-                scalar_array = ET.SubElement(cell_data, 'DataArray',
-                                              type='Float32',
-                                              Name=attr_name,
-                                              NumberOfComponents=str(num_components),
-                                              format='ascii')
-                scalar_array.text = ' '.join(map(str, attr_arr.flatten()))
+                appended.add_array(cell_data, attr_arr, 'Float32', '<f4',
+                                   Name=attr_name, NumberOfComponents=str(num_components))
 
     # Geometry section: Verts for point clouds, Polys for meshes
     if is_pc:
@@ -108,42 +135,35 @@ def export_mesh_with_scalars_vtp(trimesh: trimesh_module.Trimesh, filepath: str)
         verts = ET.SubElement(piece, 'Verts')
 
         # Connectivity: one index per point (0, 1, 2, 3, ...)
-        connectivity = ET.SubElement(verts, 'DataArray',
-                                       type='Int32',
-                                       Name='connectivity',
-                                       format='ascii')
-        connectivity.text = ' '.join(map(str, range(num_verts)))
+        appended.add_array(verts, np.arange(num_verts), 'Int32', '<i4', Name='connectivity')
 
         # Offsets: cumulative count (1, 2, 3, 4, ...)
-        offsets = ET.SubElement(verts, 'DataArray',
-                                 type='Int32',
-                                 Name='offsets',
-                                 format='ascii')
-        offsets.text = ' '.join(map(str, range(1, num_verts + 1)))
+        appended.add_array(verts, np.arange(1, num_verts + 1), 'Int32', '<i4', Name='offsets')
     else:
         # For meshes, create polygon cells (faces/triangles)
         polys = ET.SubElement(piece, 'Polys')
 
         # Connectivity: vertex indices for each face
-        connectivity = ET.SubElement(polys, 'DataArray',
-                                       type='Int32',
-                                       Name='connectivity',
-                                       format='ascii')
-        faces_flat = trimesh.faces.flatten()
-        connectivity.text = ' '.join(map(str, faces_flat))
+        appended.add_array(polys, trimesh.faces, 'Int32', '<i4', Name='connectivity')
 
         # Offsets: cumulative count of indices (each triangle has 3 vertices)
-        offsets = ET.SubElement(polys, 'DataArray',
-                                 type='Int32',
-                                 Name='offsets',
-                                 format='ascii')
-        offset_values = [(i + 1) * 3 for i in range(num_faces)]
-        offsets.text = ' '.join(map(str, offset_values))
-
-    # Write to file with pretty formatting
-    tree = ET.ElementTree(vtk_file)
-    ET.indent(tree, space='  ')
-    tree.write(filepath, encoding='utf-8', xml_declaration=True)
+        appended.add_array(polys, np.arange(1, num_faces + 1) * 3, 'Int32', '<i4', Name='offsets')
+
+    # Write the XML with pretty formatting, then splice the binary payload into the
+    # raw <AppendedData> section (data starts right after the '_' marker)
+    ET.SubElement(vtk_file, 'AppendedData', encoding='raw').text = '_'
+    ET.indent(vtk_file, space='  ')
+    xml_text = ET.tostring(vtk_file, encoding='unicode')
+    head, tail = xml_text.split('_</AppendedData>')
+
+    with open(filepath, 'wb') as f:
+        f.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+        f.write(head.encode('utf-8'))
+        f.write(b'\n    _')
+        for chunk in appended.chunks:
+            f.write(chunk)
+        f.write(b'\n  </AppendedData>')
+        f.write(tail.encode('utf-8'))
 
     if is_pc:
         print(f"[_export_mesh_with_scalars_vtp] Export complete: {num_verts} points")
@@ -17,10 +17,13 @@ import os
 import uuid
 import numpy as np
 import sys
+import tempfile
+import threading
+from collections import OrderedDict
 
 # Add parent directory to path to import utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type
+from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type, as_contiguous
 from ._vtp_export import export_mesh_with_scalars_vtp
 
 try:
@@ -29,23 +32,35 @@ try:
 except (ImportError, AttributeError):
     COMFYUI_OUTPUT_FOLDER = None
 
-# Global mesh cache for API access
-# Key: mesh_id, Value: (trimesh, current_filename, fields_added)
-_MESH_CACHE = {}
+# Global mesh cache for API access (least recently used entries are evicted)
+# Key: mesh_id, Value: (trimesh, current_filename, fields_added, analysis results, is_watertight,
+#                      ready event set once the initial preview file has been written)
+_MESH_CACHE = OrderedDict()
+MAX_CACHED_MESHES = 8
 
 
 def get_cached_mesh(mesh_id):
     """Get mesh from cache by ID."""
-    return _MESH_CACHE.get(mesh_id)
+    entry = _MESH_CACHE.get(mesh_id)
+    if entry is not None:
+        _MESH_CACHE.move_to_end(mesh_id)
+    return entry
 
 
 def set_cached_mesh(mesh_id, mesh, filename):
-    """Store mesh in cache."""
+    """Store mesh in cache, evicting the least recently used meshes beyond MAX_CACHED_MESHES."""
     _MESH_CACHE[mesh_id] = {
         'mesh': mesh,
         'filename': filename,
-        'fields': []
+        'fields': [],
+        'results': {},
+        'is_watertight': None,
+        'ready': threading.Event()
     }
+    _MESH_CACHE.move_to_end(mesh_id)
+
+    while len(_MESH_CACHE) > MAX_CACHED_MESHES:
+        _MESH_CACHE.popitem(last=False)
 
 
 def add_field_to_cached_mesh(mesh_id, field_name):
@@ -55,73 +70,142 @@ def add_field_to_cached_mesh(mesh_id, field_name):
             _MESH_CACHE[mesh_id]['fields'].append(field_name)
 
 
-def compute_boundary_vertices(mesh):
+def _get_cached_result(mesh_id, field_name):
+    """Return the cached (field, count) for an analysis on a cached mesh, or None."""
+    entry = _MESH_CACHE.get(mesh_id) if mesh_id is not None else None
+    if entry is None:
+        return None
+    return entry['results'].get(field_name)
+
+
+def _set_cached_result(mesh_id, field_name, field, count):
+    """Remember an analysis result so repeated requests skip the computation."""
+    entry = _MESH_CACHE.get(mesh_id) if mesh_id is not None else None
+    if entry is not None:
+        entry['results'][field_name] = (field, count)
+
+
+def compute_boundary_vertices(mesh, mesh_id=None):
     """
     Compute boundary/open edge vertices.
 
     Returns mesh with 'boundary_vertex' vertex attribute:
     - 1.0 = vertex is on a boundary edge
     - 0.0 = vertex is interior
+
+    If mesh_id refers to a cached mesh, the result is memoized for later calls.
     """
-    from trimesh.grouping import group_rows
+    cached = _get_cached_result(mesh_id, 'boundary_vertex')
+    if cached is not None:
+        mesh.vertex_attributes['boundary_vertex'], num_boundary = cached
+        return mesh, num_boundary
+
+    num_vertices = len(mesh.vertices)
+    entry = _MESH_CACHE.get(mesh_id) if mesh_id is not None else None
+
+    # A mesh already known to be watertight has no open edges, skip the edge sweep
+    if entry is not None and entry['is_watertight']:
+        boundary_field = np.zeros(num_vertices, dtype=np.float32)
+        mesh.vertex_attributes['boundary_vertex'] = boundary_field
+        print("[MeshAnalysis] Open edges: 0 edges, 0 vertices (mesh is watertight)")
+        _set_cached_result(mesh_id, 'boundary_vertex', boundary_field, 0)
+        return mesh, 0
 
     edges_sorted = mesh.edges_sorted
 
-    # Find boundary edges (edges that appear only once)
-    boundary_edge_indices = group_rows(edges_sorted, require_count=1)
-    boundary_edges = edges_sorted[boundary_edge_indices]
-
-    # Create vertex field
-    boundary_field = np.zeros(len(mesh.vertices), dtype=np.float32)
-    boundary_vertices = np.unique(boundary_edges.flatten())
-    boundary_field[boundary_vertices] = 1.0
+    # Find boundary edges (edges that appear only once): encode each sorted edge
+    # as a single int64 key, sort, and keep keys that differ from both neighbours
+    edge_keys = edges_sorted[:, 0].astype(np.int64) * num_vertices + edges_sorted[:, 1]
+    edge_keys.sort()
+    repeated = np.zeros(len(edge_keys), dtype=bool)
+    same_as_next = edge_keys[1:] == edge_keys[:-1]
+    repeated[1:] = same_as_next
+    repeated[:-1] |= same_as_next
+    boundary_keys = edge_keys[~repeated]
+
+    # Create vertex field (scatter writes are idempotent, so no need to unique the indices)
+    boundary_field = np.zeros(num_vertices, dtype=np.float32)
+    for boundary_vertices in np.divmod(boundary_keys, num_vertices):
+        boundary_field[boundary_vertices] = 1.0
 
     mesh.vertex_attributes['boundary_vertex'] = boundary_field
 
-    num_boundary = int(np.sum(boundary_field > 0.5))
-    print(f"[MeshAnalysis] Open edges: {len(boundary_edges)} edges, {num_boundary} vertices")
+    num_boundary = int(np.count_nonzero(boundary_field))
+    print(f"[MeshAnalysis] Open edges: {len(boundary_keys)} edges, {num_boundary} vertices")
+
+    _set_cached_result(mesh_id, 'boundary_vertex', boundary_field, num_boundary)
+    if entry is not None and num_boundary > 0:
+        entry['is_watertight'] = False
 
     return mesh, num_boundary
 
 
-def compute_connected_components(mesh):
+def compute_connected_components(mesh, mesh_id=None):
     """
     Compute connected components.
 
     Returns mesh with 'part_id' face attribute.
+
+    If mesh_id refers to a cached mesh, the result is memoized for later calls.
     """
-    components = trimesh_module.graph.connected_components(
-        mesh.face_adjacency,
-        nodes=np.arange(len(mesh.faces))
+    cached = _get_cached_result(mesh_id, 'part_id')
+    if cached is not None:
+        mesh.face_attributes['part_id'], num_components = cached
+        return mesh, num_components
+
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    num_faces = len(mesh.faces)
+    adjacency = mesh.face_adjacency
+    graph = coo_matrix(
+        (np.ones(len(adjacency), dtype=np.bool_), (adjacency[:, 0], adjacency[:, 1])),
+        shape=(num_faces, num_faces)
     )
+    num_components, labels = connected_components(graph, directed=False, return_labels=True)
 
-    part_ids = np.zeros(len(mesh.faces), dtype=np.float32)
-    for component_id, face_indices in enumerate(components):
-        part_ids[face_indices] = float(component_id)
-
+    part_ids = labels.astype(np.float32)
+    num_components = int(num_components)
     mesh.face_attributes['part_id'] = part_ids
 
-    print(f"[MeshAnalysis] Connected components: {len(components)}")
+    print(f"[MeshAnalysis] Connected components: {num_components}")
+
+    _set_cached_result(mesh_id, 'part_id', part_ids, num_components)
 
-    return mesh, len(components)
+    return mesh, num_components
 
 
-def compute_self_intersections(mesh):
+def compute_self_intersections(mesh, mesh_id=None):
     """
     Compute self-intersecting faces.
 
     Returns mesh with 'self_intersect' face attribute:
     - 1.0 = face is involved in self-intersection
     - 0.0 = face is clean
-    """
-    try:
-        import igl
 
-        V = np.asarray(mesh.vertices, dtype=np.float64)
-        F = np.asarray(mesh.faces, dtype=np.int32)
+    If mesh_id refers to a cached mesh, the result is memoized for later calls.
+    """
+    cached = _get_cached_result(mesh_id, 'self_intersect')
+    if cached is not None:
+        mesh.face_attributes['self_intersect'], num_intersecting = cached
+        return mesh, num_intersecting
 
-        # Find self-intersecting face pairs
-        IF, _ = igl.self_intersect(V, F)
+    try:
+        import igl.copyleft.cgal as cgal
+
+        # The CGAL bindings take float64/int64 (trimesh's native dtypes), so this is
+        # copy-free unless the arrays are non-contiguous
+        V = as_contiguous(mesh.vertices, np.float64)
+        F = as_contiguous(mesh.faces, np.int64)
+
+        # Find self-intersecting face pairs. CGAL runs a box-intersection broadphase
+        # first, so exact predicates are only evaluated on faces with overlapping AABBs.
+        _, _, IF, _, _ = cgal.remesh_self_intersections(
+            V, F,
+            detect_only=True,
+            first_only=False,
+            stitch_all=False
+        )
 
         # Mark all faces involved in intersections
         intersect_field = np.zeros(len(mesh.faces), dtype=np.float32)
@@ -134,10 +218,12 @@ def compute_self_intersections(mesh):
         num_intersecting = int(np.sum(intersect_field > 0.5))
         print(f"[MeshAnalysis] Self-intersections: {num_intersecting} faces")
 
+        _set_cached_result(mesh_id, 'self_intersect', intersect_field, num_intersecting)
+
         return mesh, num_intersecting
 
     except ImportError:
-        print("[MeshAnalysis] WARNING: libigl not available for self-intersection detection")
+        print("[MeshAnalysis] WARNING: libigl CGAL not available for self-intersection detection")
         # Fallback: mark no intersections
         mesh.face_attributes['self_intersect'] = np.zeros(len(mesh.faces), dtype=np.float32)
         return mesh, 0
@@ -193,24 +279,52 @@ class PreviewMeshAnalysisNode:
         if COMFYUI_OUTPUT_FOLDER:
             filepath = os.path.join(COMFYUI_OUTPUT_FOLDER, filename)
         else:
-            import tempfile
             filepath = os.path.join(tempfile.gettempdir(), filename)
 
-        # Make a copy of the mesh for caching
-        mesh_copy = trimesh.copy()
-
-        # Export mesh
-        try:
-            export_mesh_with_scalars_vtp(mesh_copy, filepath)
-            print(f"[PreviewMeshAnalysis] Exported VTP to: {filepath}")
-        except Exception as e:
-            print(f"[PreviewMeshAnalysis] VTP export failed: {e}, using STL")
-            filename = f"analysis_{mesh_id}.stl"
-            filepath = filepath.replace('.vtp', '.stl')
-            mesh_copy.export(filepath, file_type='stl')
+        # Make a mesh for caching. The analysis functions only ever write to
+        # vertex_attributes/face_attributes, never to .vertices/.faces, so the
+        # geometry arrays are shared with the input instead of deep-copied.
+        if isinstance(trimesh, trimesh_module.Trimesh):
+            mesh_copy = trimesh_module.Trimesh(
+                vertices=trimesh.vertices,
+                faces=trimesh.faces,
+                process=False
+            )
+            mesh_copy.vertex_attributes.update(trimesh.vertex_attributes)
+            mesh_copy.face_attributes.update(trimesh.face_attributes)
+        else:
+            mesh_copy = trimesh.copy()
 
         # Cache mesh for API access
         set_cached_mesh(mesh_id, mesh_copy, filename)
+        cache_entry = _MESH_CACHE[mesh_id]
+
+        # Evaluate watertightness on the cached mesh so its edge caches are reused by the
+        # analyses, and record it so open-edge analysis can short-circuit. This and the
+        # face normals used by the STL fallback are computed before the export thread
+        # starts, since trimesh's property cache is not safe to fill from two threads.
+        is_watertight = False if is_point_cloud(trimesh) else mesh_copy.is_watertight
+        if not is_point_cloud(trimesh):
+            cache_entry['is_watertight'] = bool(is_watertight)
+            _ = mesh_copy.face_normals
+
+        # Export mesh in the background so the UI response is returned immediately.
+        # The frontend polls /geompack/mesh_ready before loading the file.
+        def _write_preview():
+            try:
+                export_mesh_with_scalars_vtp(mesh_copy, filepath)
+                print(f"[PreviewMeshAnalysis] Exported VTP to: {filepath}")
+            except Exception as e:
+                print(f"[PreviewMeshAnalysis] VTP export failed: {e}, using STL")
+                try:
+                    mesh_copy.export(filepath.replace('.vtp', '.stl'), file_type='stl')
+                    cache_entry['filename'] = f"analysis_{mesh_id}.stl"
+                except Exception as e:
+                    print(f"[PreviewMeshAnalysis] STL export failed: {e}")
+            finally:
+                cache_entry['ready'].set()
+
+        threading.Thread(target=_write_preview, daemon=True).start()
 
         # Calculate bounds
         bounds = trimesh.bounds
@@ -226,7 +340,6 @@ class PreviewMeshAnalysisNode:
                 extents = np.array([1, 1, 1])
 
         max_extent = max(extents)
-        is_watertight = False if is_point_cloud(trimesh) else trimesh.is_watertight
 
         # Get existing field names
         field_names = []
@@ -247,6 +360,7 @@ class PreviewMeshAnalysisNode:
             "max_extent": [float(max_extent)],
             "is_watertight": [bool(is_watertight)],
             "field_names": [field_names],
+            "mesh_ready": [False],  # Poll /geompack/mesh_ready before loading mesh_file
         }
 
         return {"ui": ui_data}
@@ -18,10 +18,12 @@ import os
 import tempfile
 import uuid
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type
+from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type, get_bounds
+from _utils import VERBOSE
 
 from ._vtp_export import export_mesh_with_scalars_vtp
 
@@ -31,6 +33,9 @@ try:
 except (ImportError, AttributeError):
     COMFYUI_OUTPUT_FOLDER = None
 
+# Directory preview files are written to, resolved once at import
+_OUTPUT_DIR = COMFYUI_OUTPUT_FOLDER or tempfile.gettempdir()
+
 
 def extract_field_names(mesh):
     """Extract all vertex and face attribute field names from a mesh."""
@@ -44,9 +49,7 @@ def extract_field_names(mesh):
 
 def has_fields(mesh):
     """Check if mesh has any vertex or face attributes."""
-    has_vertex_attrs = hasattr(mesh, 'vertex_attributes') and len(mesh.vertex_attributes) > 0
-    has_face_attrs = hasattr(mesh, 'face_attributes') and len(mesh.face_attributes) > 0
-    return has_vertex_attrs or has_face_attrs
+    return bool(extract_field_names(mesh))
 
 
 def get_texture_info(mesh):
@@ -108,51 +111,70 @@ class PreviewMeshDualNode:
         Returns:
             dict: UI data for frontend widget
         """
-        print(f"[PreviewMeshDual] Layout: {layout}, Mode: {mode}")
-        print(f"[PreviewMeshDual] Mesh 1: {get_geometry_type(mesh_1)} - {len(mesh_1.vertices)} vertices, {get_face_count(mesh_1)} faces")
-        print(f"[PreviewMeshDual] Mesh 2: {get_geometry_type(mesh_2)} - {len(mesh_2.vertices)} vertices, {get_face_count(mesh_2)} faces")
+        vertex_count_1 = len(mesh_1.vertices)
+        vertex_count_2 = len(mesh_2.vertices)
+        face_count_1 = get_face_count(mesh_1)
+        face_count_2 = get_face_count(mesh_2)
+
+        if VERBOSE:
+            print(f"[PreviewMeshDual] Layout: {layout}, Mode: {mode}")
+            print(f"[PreviewMeshDual] Mesh 1: {get_geometry_type(mesh_1)} - {vertex_count_1} vertices, {face_count_1} faces")
+            print(f"[PreviewMeshDual] Mesh 2: {get_geometry_type(mesh_2)} - {vertex_count_2} vertices, {face_count_2} faces")
 
         # Check for field data
-        mesh_1_has_fields = has_fields(mesh_1)
-        mesh_2_has_fields = has_fields(mesh_2)
         field_names_1 = extract_field_names(mesh_1)
         field_names_2 = extract_field_names(mesh_2)
+        mesh_1_has_fields = bool(field_names_1)
+        mesh_2_has_fields = bool(field_names_2)
         common_fields = list(set(field_names_1) & set(field_names_2))
 
-        print(f"[PreviewMeshDual] Mesh 1 fields: {field_names_1}")
-        print(f"[PreviewMeshDual] Mesh 2 fields: {field_names_2}")
-        print(f"[PreviewMeshDual] Common fields: {common_fields}")
+        if VERBOSE:
+            print(f"[PreviewMeshDual] Mesh 1 fields: {field_names_1}")
+            print(f"[PreviewMeshDual] Mesh 2 fields: {field_names_2}")
+            print(f"[PreviewMeshDual] Common fields: {common_fields}")
 
         # Check for texture/visual data
         texture_info_1 = get_texture_info(mesh_1)
         texture_info_2 = get_texture_info(mesh_2)
 
-        print(f"[PreviewMeshDual] Mesh 1 visual: kind={texture_info_1['visual_kind']}, texture={texture_info_1['has_texture']}, vertex_colors={texture_info_1['has_vertex_colors']}")
-        print(f"[PreviewMeshDual] Mesh 2 visual: kind={texture_info_2['visual_kind']}, texture={texture_info_2['has_texture']}, vertex_colors={texture_info_2['has_vertex_colors']}")
+        if VERBOSE:
+            print(f"[PreviewMeshDual] Mesh 1 visual: kind={texture_info_1['visual_kind']}, texture={texture_info_1['has_texture']}, vertex_colors={texture_info_1['has_vertex_colors']}")
+            print(f"[PreviewMeshDual] Mesh 2 visual: kind={texture_info_2['visual_kind']}, texture={texture_info_2['has_texture']}, vertex_colors={texture_info_2['has_vertex_colors']}")
 
         # Check if meshes are point clouds (need VTP, STL doesn't support point clouds)
         mesh_1_is_pc = is_point_cloud(mesh_1)
         mesh_2_is_pc = is_point_cloud(mesh_2)
 
+        # Bounds (works for both meshes and point clouds) and watertightness, computed once
+        bounds_1 = get_bounds(mesh_1)
+        bounds_2 = get_bounds(mesh_2)
+        is_watertight_1 = False if mesh_1_is_pc else bool(mesh_1.is_watertight)
+        is_watertight_2 = False if mesh_2_is_pc else bool(mesh_2.is_watertight)
+
         # Generate unique ID for this preview
         preview_id = uuid.uuid4().hex[:8]
 
         if layout == "side_by_side" or layout == "slider":
-            # Export meshes separately based on mode
-            if mode == "texture":
-                # Texture mode: export as GLB
-                filename_1, filepath_1 = self._export_mesh(mesh_1, f"preview_dual_1_{preview_id}", use_vtp=False, use_glb=True)
-                filename_2, filepath_2 = self._export_mesh(mesh_2, f"preview_dual_2_{preview_id}", use_vtp=False, use_glb=True)
-            else:
-                # Fields mode: use VTP for fields OR point clouds
-                filename_1, filepath_1 = self._export_mesh(mesh_1, f"preview_dual_1_{preview_id}", use_vtp=(mesh_1_has_fields or mesh_1_is_pc), use_glb=False)
-                filename_2, filepath_2 = self._export_mesh(mesh_2, f"preview_dual_2_{preview_id}", use_vtp=(mesh_2_has_fields or mesh_2_is_pc), use_glb=False)
+            # Export meshes separately based on mode; the two writes are independent, so overlap them.
+            # The same mesh object on both inputs is exported once, since two threads would
+            # otherwise fill its (not thread-safe) trimesh property cache at the same time
+            same_mesh = mesh_1 is mesh_2
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                if mode == "texture":
+                    # Texture mode: export as GLB
+                    future_1 = executor.submit(self._export_mesh, mesh_1, f"preview_dual_1_{preview_id}", use_vtp=False, use_glb=True)
+                    future_2 = future_1 if same_mesh else executor.submit(self._export_mesh, mesh_2, f"preview_dual_2_{preview_id}", use_vtp=False, use_glb=True)
+                else:
+                    # Fields mode: use VTP for fields OR point clouds
+                    future_1 = executor.submit(self._export_mesh, mesh_1, f"preview_dual_1_{preview_id}", use_vtp=(mesh_1_has_fields or mesh_1_is_pc), use_glb=False)
+                    future_2 = future_1 if same_mesh else executor.submit(self._export_mesh, mesh_2, f"preview_dual_2_{preview_id}", use_vtp=(mesh_2_has_fields or mesh_2_is_pc), use_glb=False)
+                filename_1, filepath_1 = future_1.result()
+                filename_2, filepath_2 = future_2.result()
 
-            # Compute bounds from vertices (works for both meshes and point clouds)
-            bounds_1 = np.array([mesh_1.vertices.min(axis=0), mesh_1.vertices.max(axis=0)])
-            bounds_2 = np.array([mesh_2.vertices.min(axis=0), mesh_2.vertices.max(axis=0)])
             extents_1 = bounds_1[1] - bounds_1[0]
             extents_2 = bounds_2[1] - bounds_2[0]
+            bounds_min_1, bounds_max_1 = bounds_1.tolist()
+            bounds_min_2, bounds_max_2 = bounds_2.tolist()
 
             # Build UI data for side-by-side mode
             ui_data = {
@@ -160,18 +182,18 @@ class PreviewMeshDualNode:
                 "mode": [mode],
                 "mesh_1_file": [filename_1],
                 "mesh_2_file": [filename_2],
-                "vertex_count_1": [len(mesh_1.vertices)],
-                "vertex_count_2": [len(mesh_2.vertices)],
-                "face_count_1": [get_face_count(mesh_1)],
-                "face_count_2": [get_face_count(mesh_2)],
-                "bounds_min_1": [bounds_1[0].tolist()],
-                "bounds_max_1": [bounds_1[1].tolist()],
-                "bounds_min_2": [bounds_2[0].tolist()],
-                "bounds_max_2": [bounds_2[1].tolist()],
+                "vertex_count_1": [vertex_count_1],
+                "vertex_count_2": [vertex_count_2],
+                "face_count_1": [face_count_1],
+                "face_count_2": [face_count_2],
+                "bounds_min_1": [bounds_min_1],
+                "bounds_max_1": [bounds_max_1],
+                "bounds_min_2": [bounds_min_2],
+                "bounds_max_2": [bounds_max_2],
                 "extents_1": [extents_1.tolist()],
                 "extents_2": [extents_2.tolist()],
-                "is_watertight_1": [bool(mesh_1.is_watertight) if not is_point_cloud(mesh_1) else False],
-                "is_watertight_2": [bool(mesh_2.is_watertight) if not is_point_cloud(mesh_2) else False],
+                "is_watertight_1": [is_watertight_1],
+                "is_watertight_2": [is_watertight_2],
                 "opacity_1": [float(opacity_1)],
                 "opacity_2": [float(opacity_2)],
             }
@@ -213,9 +235,6 @@ class PreviewMeshDualNode:
                     mesh_1_has_fields, mesh_2_has_fields, use_glb=False
                 )
 
-            # Compute bounds from vertices (works for both meshes and point clouds)
-            bounds_1 = np.array([mesh_1.vertices.min(axis=0), mesh_1.vertices.max(axis=0)])
-            bounds_2 = np.array([mesh_2.vertices.min(axis=0), mesh_2.vertices.max(axis=0)])
             combined_bounds_min = np.minimum(bounds_1[0], bounds_2[0])
             combined_bounds_max = np.maximum(bounds_1[1], bounds_2[1])
             combined_extents = combined_bounds_max - combined_bounds_min
@@ -225,17 +244,17 @@ class PreviewMeshDualNode:
                 "layout": [layout],
                 "mode": [mode],
                 "mesh_file": [filename],
-                "vertex_count_1": [len(mesh_1.vertices)],
-                "vertex_count_2": [len(mesh_2.vertices)],
-                "face_count_1": [get_face_count(mesh_1)],
-                "face_count_2": [get_face_count(mesh_2)],
+                "vertex_count_1": [vertex_count_1],
+                "vertex_count_2": [vertex_count_2],
+                "face_count_1": [face_count_1],
+                "face_count_2": [face_count_2],
                 "bounds_min": [combined_bounds_min.tolist()],
                 "bounds_max": [combined_bounds_max.tolist()],
                 "extents": [combined_extents.tolist()],
                 "opacity_1": [float(opacity_1)],
                 "opacity_2": [float(opacity_2)],
-                "is_watertight_1": [bool(mesh_1.is_watertight) if not is_point_cloud(mesh_1) else False],
-                "is_watertight_2": [bool(mesh_2.is_watertight) if not is_point_cloud(mesh_2) else False],
+                "is_watertight_1": [is_watertight_1],
+                "is_watertight_2": [is_watertight_2],
             }
 
             # Add mode-specific metadata
@@ -262,7 +281,8 @@ class PreviewMeshDualNode:
                     "common_fields": [overlay_common],
                 })
 
-        print(f"[PreviewMeshDual] Preview ready")
+        if VERBOSE:
+            print(f"[PreviewMeshDual] Preview ready")
         return {"ui": ui_data}
 
     def _export_mesh(self, mesh, base_filename, use_vtp, use_glb):
@@ -274,21 +294,21 @@ class PreviewMeshDualNode:
         else:
             filename = f"{base_filename}.stl"
 
-        if COMFYUI_OUTPUT_FOLDER:
-            filepath = os.path.join(COMFYUI_OUTPUT_FOLDER, filename)
-        else:
-            filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = os.path.join(_OUTPUT_DIR, filename)
 
         try:
             if use_glb:
                 mesh.export(filepath, file_type='glb', include_normals=True)
-                print(f"[PreviewMeshDual] Exported GLB: {filepath}")
+                if VERBOSE:
+                    print(f"[PreviewMeshDual] Exported GLB: {filepath}")
             elif use_vtp:
                 export_mesh_with_scalars_vtp(mesh, filepath)
-                print(f"[PreviewMeshDual] Exported VTP with fields: {filepath}")
+                if VERBOSE:
+                    print(f"[PreviewMeshDual] Exported VTP with fields: {filepath}")
             else:
                 mesh.export(filepath, file_type='stl')
-                print(f"[PreviewMeshDual] Exported STL: {filepath}")
+                if VERBOSE:
+                    print(f"[PreviewMeshDual] Exported STL: {filepath}")
         except Exception as e:
             print(f"[PreviewMeshDual] Export failed: {e}, trying fallback")
             # Fallback to OBJ
@@ -309,44 +329,61 @@ class PreviewMeshDualNode:
 
         # Combine meshes with automatic color distinction
         try:
-            # Create copies to avoid modifying original meshes
-            mesh_1_copy = mesh_1.copy()
-            mesh_2_copy = mesh_2.copy()
+            # Stack the geometry directly (no copies of the inputs, no processing pass)
+            num_verts_1 = len(mesh_1.vertices)
+            num_verts_2 = len(mesh_2.vertices)
+            combined = trimesh_module.Trimesh(
+                vertices=np.concatenate([mesh_1.vertices, mesh_2.vertices]),
+                faces=np.concatenate([mesh_1.faces, mesh_2.faces + num_verts_1]),
+                process=False
+            )
+
+            # Keep vertex and face fields present on both meshes
+            for kind in ('vertex_attributes', 'face_attributes'):
+                attrs_1 = getattr(mesh_1, kind)
+                attrs_2 = getattr(mesh_2, kind)
+                combined_attrs = getattr(combined, kind)
+                for name in attrs_1:
+                    if name in attrs_2:
+                        values_1 = np.asarray(attrs_1[name])
+                        values_2 = np.asarray(attrs_2[name])
+                        if values_1.shape[1:] == values_2.shape[1:]:
+                            combined_attrs[name] = np.concatenate([values_1, values_2])
 
             # Add mesh_id field for distinction in fields mode (0 = mesh_1, 1 = mesh_2)
-            mesh_1_copy.vertex_attributes['mesh_id'] = np.zeros(len(mesh_1_copy.vertices), dtype=np.float32)
-            mesh_2_copy.vertex_attributes['mesh_id'] = np.ones(len(mesh_2_copy.vertices), dtype=np.float32)
-
-            # Apply red vertex colors to mesh_1 (RGBA: 255, 77, 77, 255) for texture mode
-            red_colors = np.full((len(mesh_1_copy.vertices), 4), [255, 77, 77, 255], dtype=np.uint8)
-            mesh_1_copy.visual.vertex_colors = red_colors
+            combined.vertex_attributes['mesh_id'] = np.repeat(
+                np.array([0.0, 1.0], dtype=np.float32), [num_verts_1, num_verts_2]
+            )
 
-            # Apply blue vertex colors to mesh_2 (RGBA: 77, 77, 255, 255) for texture mode
-            blue_colors = np.full((len(mesh_2_copy.vertices), 4), [77, 77, 255, 255], dtype=np.uint8)
-            mesh_2_copy.visual.vertex_colors = blue_colors
+            # Apply red (RGBA: 255, 77, 77, 255) to mesh_1 and blue (RGBA: 77, 77, 255, 255)
+            # to mesh_2 as vertex colors for texture mode
+            combined.visual.vertex_colors = np.repeat(
+                np.array([[255, 77, 77, 255], [77, 77, 255, 255]], dtype=np.uint8),
+                [num_verts_1, num_verts_2],
+                axis=0
+            )
 
-            print(f"[PreviewMeshDual] Added mesh_id field and red/blue colors for overlay")
-
-            combined = trimesh_module.util.concatenate([mesh_1_copy, mesh_2_copy])
+            if VERBOSE:
+                print(f"[PreviewMeshDual] Added mesh_id field and red/blue colors for overlay")
 
             if use_glb:
                 filename = f"preview_dual_overlay_{preview_id}.glb"
             else:
                 filename = f"preview_dual_overlay_{preview_id}.vtp"
 
-            if COMFYUI_OUTPUT_FOLDER:
-                filepath = os.path.join(COMFYUI_OUTPUT_FOLDER, filename)
-            else:
-                filepath = os.path.join(tempfile.gettempdir(), filename)
+            filepath = os.path.join(_OUTPUT_DIR, filename)
 
             if use_glb:
                 combined.export(filepath, file_type='glb', include_normals=True)
-                print(f"[PreviewMeshDual] Exported combined GLB: {filepath}")
+                if VERBOSE:
+                    print(f"[PreviewMeshDual] Exported combined GLB: {filepath}")
             else:
                 export_mesh_with_scalars_vtp(combined, filepath)
-                print(f"[PreviewMeshDual] Exported combined VTP: {filepath}")
+                if VERBOSE:
+                    print(f"[PreviewMeshDual] Exported combined VTP: {filepath}")
 
-            print(f"[PreviewMeshDual] Combined {get_geometry_type(combined)}: {len(combined.vertices)} vertices, {get_face_count(combined)} faces")
+            if VERBOSE:
+                print(f"[PreviewMeshDual] Combined {get_geometry_type(combined)}: {num_verts_1 + num_verts_2} vertices, {get_face_count(combined)} faces")
             return filename, filepath
         except Exception as e:
             print(f"[PreviewMeshDual] Failed to export combined mesh: {e}")
@@ -13,16 +13,17 @@ Grid layouts:
 Supports scalar field visualization with synchronized cameras across viewports.
 """
 
-import trimesh as trimesh_module
 import numpy as np
 import os
 import tempfile
 import uuid
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type
+from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type, get_bounds
+from _utils import VERBOSE
 
 from ._vtp_export import export_mesh_with_scalars_vtp
 
@@ -32,6 +33,9 @@ try:
 except (ImportError, AttributeError):
     COMFYUI_OUTPUT_FOLDER = None
 
+# Directory preview files are written to, resolved once at import
+_OUTPUT_DIR = COMFYUI_OUTPUT_FOLDER or tempfile.gettempdir()
+
 
 def extract_field_names(mesh):
     """Extract all vertex and face attribute field names from a mesh."""
@@ -45,9 +49,7 @@ def extract_field_names(mesh):
 
 def has_fields(mesh):
     """Check if mesh has any vertex or face attributes."""
-    has_vertex_attrs = hasattr(mesh, 'vertex_attributes') and len(mesh.vertex_attributes) > 0
-    has_face_attrs = hasattr(mesh, 'face_attributes') and len(mesh.face_attributes) > 0
-    return has_vertex_attrs or has_face_attrs
+    return bool(extract_field_names(mesh))
 
 
 def get_texture_info(mesh):
@@ -120,7 +122,8 @@ class PreviewMeshMultiNode:
             meshes.append(mesh_4)
 
         num_meshes = len(meshes)
-        print(f"[PreviewMeshMulti] Mode: {mode}, Meshes: {num_meshes}")
+        if VERBOSE:
+            print(f"[PreviewMeshMulti] Mode: {mode}, Meshes: {num_meshes}")
 
         # Generate unique ID for this preview
         preview_id = uuid.uuid4().hex[:8]
@@ -129,63 +132,54 @@ class PreviewMeshMultiNode:
         mesh_files = []
         vertex_counts = []
         face_counts = []
-        bounds_list = []
-        extents_list = []
+        bounds_arr = np.empty((num_meshes, 2, 3))
         is_watertight_list = []
-        field_names_list = []
         texture_info_list = []
 
+        field_names_list = [extract_field_names(mesh) for mesh in meshes]
+
+        # Exports are independent file writes, so run them concurrently. Each distinct mesh
+        # object is exported once: the same mesh wired into several inputs would otherwise
+        # have its (not thread-safe) trimesh property cache filled from two threads at once
+        first_index = {}
+        for i, mesh in enumerate(meshes):
+            first_index.setdefault(id(mesh), i)
+        unique_indices = list(first_index.values())
+        with ThreadPoolExecutor(max_workers=len(unique_indices)) as executor:
+            unique_exports = dict(zip(unique_indices, executor.map(
+                lambda i: self._export_mesh(i, meshes[i], preview_id, mode, bool(field_names_list[i])),
+                unique_indices
+            )))
+        exports = [
+            unique_exports[i] if i in unique_exports else (unique_exports[first_index[id(mesh)]][0], [])
+            for i, mesh in enumerate(meshes)
+        ]
+
         for i, mesh in enumerate(meshes):
-            print(f"[PreviewMeshMulti] Mesh {i+1}: {get_geometry_type(mesh)} - {len(mesh.vertices)} vertices, {get_face_count(mesh)} faces")
+            filename, log_lines = exports[i]
+            vertex_count = len(mesh.vertices)
+            face_count = get_face_count(mesh)
+            if VERBOSE:
+                print(f"[PreviewMeshMulti] Mesh {i+1}: {get_geometry_type(mesh)} - {vertex_count} vertices, {face_count} faces")
+            for line in log_lines:
+                print(line)
 
-            # Check for field data and texture info
-            mesh_has_fields = has_fields(mesh)
             mesh_is_pc = is_point_cloud(mesh)
             texture_info = get_texture_info(mesh)
 
-            # Export mesh
-            if mode == "texture":
-                filename = f"preview_multi_{i+1}_{preview_id}.glb"
-            elif mesh_has_fields or mesh_is_pc:
-                filename = f"preview_multi_{i+1}_{preview_id}.vtp"
-            else:
-                filename = f"preview_multi_{i+1}_{preview_id}.stl"
-
-            if COMFYUI_OUTPUT_FOLDER:
-                filepath = os.path.join(COMFYUI_OUTPUT_FOLDER, filename)
-            else:
-                filepath = os.path.join(tempfile.gettempdir(), filename)
-
-            try:
-                if mode == "texture":
-                    mesh.export(filepath, file_type='glb', include_normals=True)
-                    print(f"[PreviewMeshMulti] Exported GLB: {filepath}")
-                elif mesh_has_fields or mesh_is_pc:
-                    export_mesh_with_scalars_vtp(mesh, filepath)
-                    print(f"[PreviewMeshMulti] Exported VTP: {filepath}")
-                else:
-                    mesh.export(filepath, file_type='stl')
-                    print(f"[PreviewMeshMulti] Exported STL: {filepath}")
-            except Exception as e:
-                print(f"[PreviewMeshMulti] Export failed: {e}, trying OBJ fallback")
-                filename = f"preview_multi_{i+1}_{preview_id}.obj"
-                filepath = os.path.join(COMFYUI_OUTPUT_FOLDER or tempfile.gettempdir(), filename)
-                mesh.export(filepath, file_type='obj')
-
             # Collect metadata
             mesh_files.append(filename)
-            vertex_counts.append(len(mesh.vertices))
-            face_counts.append(get_face_count(mesh))
+            vertex_counts.append(vertex_count)
+            face_counts.append(face_count)
 
-            bounds = np.array([mesh.vertices.min(axis=0), mesh.vertices.max(axis=0)])
-            extents = bounds[1] - bounds[0]
-            bounds_list.append(bounds.tolist())
-            extents_list.append(extents.tolist())
+            bounds_arr[i] = get_bounds(mesh)
 
             is_watertight_list.append(bool(mesh.is_watertight) if not mesh_is_pc else False)
-            field_names_list.append(extract_field_names(mesh))
             texture_info_list.append(texture_info)
 
+        # Per-mesh extents in one vectorized pass
+        extents_arr = bounds_arr[:, 1] - bounds_arr[:, 0]
+
         # Determine grid layout
         if num_meshes == 1:
             grid_cols, grid_rows = 1, 1
@@ -205,8 +199,8 @@ class PreviewMeshMultiNode:
             "mesh_files": [mesh_files],
             "vertex_counts": [vertex_counts],
             "face_counts": [face_counts],
-            "bounds_list": [bounds_list],
-            "extents_list": [extents_list],
+            "bounds_list": [bounds_arr.tolist()],
+            "extents_list": [extents_arr.tolist()],
             "is_watertight_list": [is_watertight_list],
         }
 
@@ -216,9 +210,54 @@ class PreviewMeshMultiNode:
         else:
             ui_data["field_names_list"] = [field_names_list]
 
-        print(f"[PreviewMeshMulti] Grid: {grid_cols}x{grid_rows}, Preview ready")
+        if VERBOSE:
+            print(f"[PreviewMeshMulti] Grid: {grid_cols}x{grid_rows}, Preview ready")
         return {"ui": ui_data}
 
+    def _export_mesh(self, index, mesh, preview_id, mode, mesh_has_fields):
+        """
+        Export one mesh of the grid to a file the viewer can load.
+
+        Runs on a worker thread, so log messages are returned for the caller
+        to print in order instead of being printed here. Success messages are
+        only collected when VERBOSE is set; failures are always reported.
+
+        Returns:
+            tuple: (filename, log_lines)
+        """
+        log_lines = []
+        use_vtp = mesh_has_fields or is_point_cloud(mesh)
+
+        if mode == "texture":
+            filename = f"preview_multi_{index+1}_{preview_id}.glb"
+        elif use_vtp:
+            filename = f"preview_multi_{index+1}_{preview_id}.vtp"
+        else:
+            filename = f"preview_multi_{index+1}_{preview_id}.stl"
+
+        filepath = os.path.join(_OUTPUT_DIR, filename)
+
+        try:
+            if mode == "texture":
+                mesh.export(filepath, file_type='glb', include_normals=True)
+                if VERBOSE:
+                    log_lines.append(f"[PreviewMeshMulti] Exported GLB: {filepath}")
+            elif use_vtp:
+                export_mesh_with_scalars_vtp(mesh, filepath)
+                if VERBOSE:
+                    log_lines.append(f"[PreviewMeshMulti] Exported VTP: {filepath}")
+            else:
+                mesh.export(filepath, file_type='stl')
+                if VERBOSE:
+                    log_lines.append(f"[PreviewMeshMulti] Exported STL: {filepath}")
+        except Exception as e:
+            log_lines.append(f"[PreviewMeshMulti] Export failed: {e}, trying OBJ fallback")
+            filename = f"preview_multi_{index+1}_{preview_id}.obj"
+            filepath = os.path.join(_OUTPUT_DIR, filename)
+            mesh.export(filepath, file_type='obj')
+
+        return filename, log_lines
+
 
 NODE_CLASS_MAPPINGS = {
     "GeomPackPreviewMeshMulti": PreviewMeshMultiNode,
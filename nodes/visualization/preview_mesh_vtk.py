@@ -11,15 +11,21 @@ Supports scalar field visualization: automatically detects vertex and face
 attributes and exports to VTP format to preserve field data for visualization.
 """
 
-import trimesh as trimesh_module
+import hashlib
+import numpy as np
 import os
 import tempfile
+import threading
 import uuid
 import sys
+from collections import OrderedDict
+
+import trimesh as trimesh_module
 
 # Add parent directory to path to import utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from _utils.mesh_ops import is_point_cloud, get_face_count, get_geometry_type
+from _utils.mesh_ops import classify_mesh, get_bounds
+from _utils import VERBOSE
 from ._vtp_export import export_mesh_with_scalars_vtp
 
 try:
@@ -28,6 +34,69 @@ try:
 except (ImportError, AttributeError):
     COMFYUI_OUTPUT_FOLDER = None
 
+# Directory preview files are written to, resolved once at import
+_OUTPUT_DIR = COMFYUI_OUTPUT_FOLDER or tempfile.gettempdir()
+
+# Above this face count the edge-adjacency build behind is_watertight is skipped
+# and watertightness/volume are reported as unknown
+WATERTIGHT_FACE_LIMIT = 500_000
+
+# Write fields-mode VTP previews on a background thread so the node returns once the
+# metadata is ready; the frontend polls /geompack/preview_ready for the written filename
+ASYNC_EXPORT = True
+
+# Background exports keyed by initial filename: ready event and final filename
+# (which differs if the export fell back to OBJ). Oldest entries are dropped.
+_PENDING_EXPORTS = OrderedDict()
+MAX_PENDING_EXPORTS = 64
+
+
+def get_pending_export(filename):
+    """Get the background export entry for a preview filename, or None."""
+    return _PENDING_EXPORTS.get(filename)
+
+
+def _export_snapshot(mesh):
+    """
+    Mesh object for the background export thread to use on its own.
+
+    Geometry arrays are shared (the export only reads them) but the attribute
+    dicts are copied, so later changes to the input mesh's fields or property
+    cache cannot race with the export.
+    """
+    if isinstance(mesh, trimesh_module.Trimesh):
+        snapshot = trimesh_module.Trimesh(vertices=mesh.vertices, faces=mesh.faces, process=False)
+        snapshot.vertex_attributes.update(mesh.vertex_attributes)
+        snapshot.face_attributes.update(mesh.face_attributes)
+        return snapshot
+    return mesh.copy()
+
+
+def _geometry_hash(mesh):
+    """Short BLAKE2b digest of a mesh's vertex and face buffers."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(mesh.vertices.tobytes())
+    h.update(mesh.faces.tobytes())
+    return h.hexdigest()
+
+
+def _fields_preview_key(mesh):
+    """
+    Reuse key for a fields-mode preview.
+
+    hash(mesh) is trimesh's CRC of the vertex/face buffers, which trimesh caches
+    and only recomputes after they are modified. It does not cover attributes,
+    so a BLAKE2b digest of their names and contents is added; attribute arrays
+    are plain numpy arrays and can be edited in place without trimesh noticing.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for prefix, attrs in (("vertex.", getattr(mesh, 'vertex_attributes', {})),
+                          ("face.", getattr(mesh, 'face_attributes', {}))):
+        for name, values in attrs.items():
+            h.update(f"{prefix}{name}".encode())
+            h.update(np.ascontiguousarray(values).tobytes())
+    return (id(mesh), hash(mesh), h.hexdigest())
+
 
 class PreviewMeshVTKNode:
     """
@@ -54,6 +123,11 @@ class PreviewMeshVTKNode:
     FUNCTION = "preview_mesh_vtk"
     CATEGORY = "geompack/visualization"
 
+    # Last fields-mode preview, reused when the same unchanged mesh is previewed again
+    _last_key = None
+    _last_ui = None
+    _last_path = None
+
     def preview_mesh_vtk(self, mode="fields", trimesh=None, voxelgrid=None):
         """
         Export mesh and prepare for VTK.js preview.
@@ -64,7 +138,7 @@ class PreviewMeshVTKNode:
 
         Args:
             mode: Visualization mode - "fields" or "texture"
-            trimesh: Input trimesh_module.Trimesh object (optional)
+            trimesh: Input trimesh.Trimesh object (optional)
             voxelgrid: Input trimesh.VoxelGrid object (optional)
 
         Returns:
@@ -76,32 +150,50 @@ class PreviewMeshVTKNode:
 
         mesh_input = trimesh if trimesh is not None else voxelgrid
 
+        # Fields-mode output depends only on geometry and attributes, so an unchanged
+        # mesh can reuse the previous preview without re-exporting or re-measuring it
+        preview_key = None
+        if mode == "fields" and trimesh is not None:
+            preview_key = _fields_preview_key(trimesh)
+            if preview_key == self._last_key and self._last_preview_available():
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Mesh unchanged, reusing preview: {self._last_path}")
+                return {"ui": self._last_ui}
+
         # Handle VOXEL_GRID input (trimesh.VoxelGrid from MeshToVoxel node)
         if hasattr(mesh_input, 'as_boxes'):  # It's a trimesh.VoxelGrid
             voxel_shape = mesh_input.matrix.shape
             trimesh = mesh_input.as_boxes()
-            print(f"[PreviewMeshVTK] Converted voxel grid {voxel_shape} to box mesh: {len(trimesh.vertices)} vertices")
+            if VERBOSE:
+                print(f"[PreviewMeshVTK] Converted voxel grid {voxel_shape} to box mesh: {len(trimesh.vertices)} vertices")
         else:
             trimesh = mesh_input
 
-        print(f"[PreviewMeshVTK] Preparing preview: {get_geometry_type(trimesh)} - {len(trimesh.vertices)} vertices, {get_face_count(trimesh)} faces")
+        vertex_count = len(trimesh.vertices)
+        geometry_type, face_count, is_pc = classify_mesh(trimesh)
+
+        if VERBOSE:
+            print(f"[PreviewMeshVTK] Preparing preview: {geometry_type} - {vertex_count} vertices, {face_count} faces")
 
-        # Check for scalar fields (vertex/face attributes)
-        has_vertex_attrs = hasattr(trimesh, 'vertex_attributes') and len(trimesh.vertex_attributes) > 0
-        has_face_attrs = hasattr(trimesh, 'face_attributes') and len(trimesh.face_attributes) > 0
+        # Check for scalar fields (vertex/face attributes); names are collected once and reused below
+        vertex_attr_names = list(trimesh.vertex_attributes.keys()) if hasattr(trimesh, 'vertex_attributes') else []
+        face_attr_names = list(trimesh.face_attributes.keys()) if hasattr(trimesh, 'face_attributes') else []
+        has_vertex_attrs = len(vertex_attr_names) > 0
+        has_face_attrs = len(face_attr_names) > 0
         has_fields = has_vertex_attrs or has_face_attrs
 
-        print(f"[PreviewMeshVTK] DEBUG - hasattr vertex_attributes: {hasattr(trimesh, 'vertex_attributes')}")
-        print(f"[PreviewMeshVTK] DEBUG - hasattr face_attributes: {hasattr(trimesh, 'face_attributes')}")
-        if hasattr(trimesh, 'vertex_attributes'):
-            print(f"[PreviewMeshVTK] DEBUG - vertex_attributes: {trimesh.vertex_attributes}")
-            print(f"[PreviewMeshVTK] DEBUG - len(vertex_attributes): {len(trimesh.vertex_attributes)}")
-        if hasattr(trimesh, 'face_attributes'):
-            print(f"[PreviewMeshVTK] DEBUG - face_attributes: {trimesh.face_attributes}")
-            print(f"[PreviewMeshVTK] DEBUG - len(face_attributes): {len(trimesh.face_attributes)}")
-        print(f"[PreviewMeshVTK] DEBUG - has_vertex_attrs: {has_vertex_attrs}")
-        print(f"[PreviewMeshVTK] DEBUG - has_face_attrs: {has_face_attrs}")
-        print(f"[PreviewMeshVTK] DEBUG - has_fields: {has_fields}")
+        if VERBOSE:
+            print(f"[PreviewMeshVTK] DEBUG - hasattr vertex_attributes: {hasattr(trimesh, 'vertex_attributes')}")
+            print(f"[PreviewMeshVTK] DEBUG - hasattr face_attributes: {hasattr(trimesh, 'face_attributes')}")
+            if hasattr(trimesh, 'vertex_attributes'):
+                print(f"[PreviewMeshVTK] DEBUG - vertex_attributes: {trimesh.vertex_attributes}")
+                print(f"[PreviewMeshVTK] DEBUG - len(vertex_attributes): {len(trimesh.vertex_attributes)}")
+            if hasattr(trimesh, 'face_attributes'):
+                print(f"[PreviewMeshVTK] DEBUG - face_attributes: {trimesh.face_attributes}")
+                print(f"[PreviewMeshVTK] DEBUG - len(face_attributes): {len(trimesh.face_attributes)}")
+            print(f"[PreviewMeshVTK] DEBUG - has_vertex_attrs: {has_vertex_attrs}")
+            print(f"[PreviewMeshVTK] DEBUG - has_face_attrs: {has_face_attrs}")
+            print(f"[PreviewMeshVTK] DEBUG - has_fields: {has_fields}")
 
         # Check for visual data (textures/vertex colors)
         has_visual = hasattr(trimesh, 'visual') and trimesh.visual is not None
@@ -110,40 +202,40 @@ class PreviewMeshVTKNode:
         has_vertex_colors = visual_kind == 'vertex' if has_visual else False
         has_material = has_texture
 
-        print(f"[PreviewMeshVTK] Mode: {mode}")
-        print(f"[PreviewMeshVTK] Visual data - has_visual: {has_visual}, kind: {visual_kind}, texture: {has_texture}, vertex_colors: {has_vertex_colors}")
-
-        # Check if this is a point cloud
-        is_pc = is_point_cloud(trimesh)
+        if VERBOSE:
+            print(f"[PreviewMeshVTK] Mode: {mode}")
+            print(f"[PreviewMeshVTK] Visual data - has_visual: {has_visual}, kind: {visual_kind}, texture: {has_texture}, vertex_colors: {has_vertex_colors}")
 
         # Choose export format based on visualization mode
         if mode == "texture (PBR)":
             # PBR mode: Export GLB and use Three.js PBR viewer
             filename = f"preview_vtk_{uuid.uuid4().hex[:8]}.glb"
             viewer_type = "pbr"
-            print(f"[PreviewMeshVTK] Using PBR mode - GLB export with Three.js PBR viewer")
+            if VERBOSE:
+                print(f"[PreviewMeshVTK] Using PBR mode - GLB export with Three.js PBR viewer")
         elif mode == "texture":
             # Texture mode: Export GLB to preserve textures/materials/UVs
             filename = f"preview_vtk_{uuid.uuid4().hex[:8]}.glb"
             viewer_type = "texture"
-            print(f"[PreviewMeshVTK] Using texture mode - GLB export")
+            if VERBOSE:
+                print(f"[PreviewMeshVTK] Using texture mode - GLB export")
         else:
             # Fields mode: Export VTP/STL for scalar field visualization
             if has_fields or is_pc:
                 # Export to VTP for: scalar fields OR point clouds (STL doesn't support point clouds)
                 filename = f"preview_vtk_{uuid.uuid4().hex[:8]}.vtp"
-                print(f"[PreviewMeshVTK] Using VTP format (fields={has_fields}, point_cloud={is_pc})")
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Using VTP format (fields={has_fields}, point_cloud={is_pc})")
             else:
-                # Export to STL (compact format for simple surface meshes)
-                filename = f"preview_vtk_{uuid.uuid4().hex[:8]}.stl"
+                # Export to STL (compact format for simple surface meshes); named after the
+                # geometry so rerunning with an unchanged mesh reuses the existing file
+                filename = f"preview_vtk_{_geometry_hash(trimesh)}.stl"
             viewer_type = "fields"
-            print(f"[PreviewMeshVTK] Using fields mode - VTP/STL export")
+            if VERBOSE:
+                print(f"[PreviewMeshVTK] Using fields mode - VTP/STL export")
 
         # Use ComfyUI's output directory
-        if COMFYUI_OUTPUT_FOLDER:
-            filepath = os.path.join(COMFYUI_OUTPUT_FOLDER, filename)
-        else:
-            filepath = os.path.join(tempfile.gettempdir(), filename)
+        filepath = os.path.join(_OUTPUT_DIR, filename)
 
         # Set alpha mode based on viewing mode
         if mode == "texture":
@@ -151,61 +243,40 @@ class PreviewMeshVTKNode:
             if hasattr(trimesh, 'visual') and hasattr(trimesh.visual, 'material'):
                 if hasattr(trimesh.visual.material, 'alphaMode'):
                     trimesh.visual.material.alphaMode = 'OPAQUE'
-                    print(f"[PreviewMeshVTK] Set alphaMode to OPAQUE for texture mode")
+                    if VERBOSE:
+                        print(f"[PreviewMeshVTK] Set alphaMode to OPAQUE for texture mode")
         elif mode == "texture (PBR)":
             # PBR mode: use BLEND for transparency support
             if hasattr(trimesh, 'visual') and hasattr(trimesh.visual, 'material'):
                 if hasattr(trimesh.visual.material, 'alphaMode'):
                     trimesh.visual.material.alphaMode = 'BLEND'
-                    print(f"[PreviewMeshVTK] Set alphaMode to BLEND for PBR mode")
-
-        # Export mesh
-        try:
-            if mode in ("texture", "texture (PBR)"):
-                # Export GLB for texture/PBR rendering
-                trimesh.export(filepath, file_type='glb', include_normals=True)
-                print(f"[PreviewMeshVTK] Exported GLB to: {filepath}")
-            elif has_fields or is_pc:
-                # Use VTP exporter for fields or point clouds
-                export_mesh_with_scalars_vtp(trimesh, filepath)
-                print(f"[PreviewMeshVTK] Exported VTP to: {filepath}")
-            else:
-                # Use STL for simple surface meshes
-                trimesh.export(filepath, file_type='stl')
-                print(f"[PreviewMeshVTK] Exported STL to: {filepath}")
-        except Exception as e:
-            print(f"[PreviewMeshVTK] Export failed: {e}")
-            # Fallback to OBJ
-            filename = filename.replace('.vtp', '.obj').replace('.stl', '.obj')
-            filepath = filepath.replace('.vtp', '.obj').replace('.stl', '.obj')
-            trimesh.export(filepath, file_type='obj')
-            print(f"[PreviewMeshVTK] Exported to OBJ: {filepath}")
-
-        # Calculate bounding box info for camera setup
-        bounds = trimesh.bounds
-        extents = trimesh.extents
-
-        # Handle case where extents/bounds are None (can happen with certain mesh configurations)
-        if extents is None or bounds is None:
-            import numpy as np
-            vertices_arr = np.asarray(trimesh.vertices)
-            if len(vertices_arr) > 0:
-                bounds = np.array([vertices_arr.min(axis=0), vertices_arr.max(axis=0)])
-                extents = bounds[1] - bounds[0]
-            else:
-                # Empty mesh - use default bounds
-                bounds = np.array([[0, 0, 0], [1, 1, 1]])
-                extents = np.array([1, 1, 1])
-
-        max_extent = max(extents)
+                    if VERBOSE:
+                        print(f"[PreviewMeshVTK] Set alphaMode to BLEND for PBR mode")
 
-        # Check if mesh is watertight (only for actual meshes, not point clouds)
-        is_watertight = False if is_point_cloud(trimesh) else trimesh.is_watertight
+        # Calculate bounding box info for camera setup (extents derived from the same bounds)
+        if vertex_count > 0:
+            bounds = get_bounds(trimesh)
+        else:
+            # Empty mesh - use default bounds
+            bounds = np.array([[0, 0, 0], [1, 1, 1]])
+        extents = bounds[1] - bounds[0]
+        max_extent = extents.max()
+
+        # Check if mesh is watertight (only for actual meshes, not point clouds);
+        # None means it was too large to check and is reported as unknown
+        if is_pc:
+            is_watertight = False
+        elif face_count > WATERTIGHT_FACE_LIMIT:
+            is_watertight = None
+            if VERBOSE:
+                print(f"[PreviewMeshVTK] Skipping watertight check for {face_count} faces (limit {WATERTIGHT_FACE_LIMIT})")
+        else:
+            is_watertight = trimesh.is_watertight
 
         # Calculate volume and area (only for meshes with faces, not point clouds)
         volume = None
         area = None
-        if not is_point_cloud(trimesh):
+        if not is_pc:
             try:
                 if is_watertight:
                     volume = float(trimesh.volume)
@@ -214,27 +285,52 @@ class PreviewMeshVTKNode:
                 print(f"[PreviewMeshVTK] Could not calculate volume/area: {e}")
 
         # Get field names (vertex/face data arrays) - for field visualization UI
-        field_names = []
-        if has_vertex_attrs:
-            field_names.extend(list(trimesh.vertex_attributes.keys()))
-            print(f"[PreviewMeshVTK] Vertex attributes: {list(trimesh.vertex_attributes.keys())}")
-        if has_face_attrs:
-            field_names.extend([f"face.{k}" for k in trimesh.face_attributes.keys()])
-            print(f"[PreviewMeshVTK] Face attributes: {list(trimesh.face_attributes.keys())}")
-
-        # Return metadata for frontend widget
+        field_names = vertex_attr_names + [f"face.{k}" for k in face_attr_names]
+        if VERBOSE:
+            if has_vertex_attrs:
+                print(f"[PreviewMeshVTK] Vertex attributes: {vertex_attr_names}")
+            if has_face_attrs:
+                print(f"[PreviewMeshVTK] Face attributes: {face_attr_names}")
+
+        # Export mesh. All trimesh properties above are computed before any thread starts,
+        # since trimesh's property cache is not safe to populate from two threads at once;
+        # only the VTP export runs in the background, on its own snapshot of the mesh.
+        use_vtp = has_fields or is_pc
+        export_async = ASYNC_EXPORT and use_vtp and viewer_type == "fields"
+        if export_async:
+            export_mesh = _export_snapshot(trimesh)
+            export_entry = {'filename': filename, 'ready': threading.Event()}
+            _PENDING_EXPORTS[filename] = export_entry
+            while len(_PENDING_EXPORTS) > MAX_PENDING_EXPORTS:
+                _PENDING_EXPORTS.popitem(last=False)
+
+            def _write_preview():
+                try:
+                    export_entry['filename'], _ = self._export_preview(export_mesh, filename, filepath, mode, use_vtp)
+                except Exception as e:
+                    print(f"[PreviewMeshVTK] Background export failed: {e}")
+                finally:
+                    export_entry['ready'].set()
+
+            threading.Thread(target=_write_preview, daemon=True).start()
+        else:
+            filename, filepath = self._export_preview(trimesh, filename, filepath, mode, use_vtp)
+
+        # Return metadata for frontend widget (bounds converted to lists in one pass)
+        bounds_min, bounds_max = bounds.tolist()
         ui_data = {
             "mesh_file": [filename],
             "viewer_type": [viewer_type],  # "fields" or "texture" - tells frontend which viewer to load
             "mode": [mode],  # User-selected mode
-            "vertex_count": [len(trimesh.vertices)],
-            "face_count": [get_face_count(trimesh)],
-            "bounds_min": [bounds[0].tolist()],
-            "bounds_max": [bounds[1].tolist()],
+            "vertex_count": [vertex_count],
+            "face_count": [face_count],
+            "bounds_min": [bounds_min],
+            "bounds_max": [bounds_max],
             "extents": [extents.tolist()],
             "max_extent": [float(max_extent)],
-            "is_watertight": [bool(is_watertight)],
         }
+        # null tells the frontend the check was skipped rather than failed
+        ui_data["is_watertight"] = [None if is_watertight is None else bool(is_watertight)]
 
         # Add mode-specific metadata
         if viewer_type in ("texture", "pbr"):
@@ -252,21 +348,85 @@ class PreviewMeshVTKNode:
         # Add optional fields if available
         if volume is not None:
             ui_data["volume"] = [volume]
+        elif is_watertight is None:
+            ui_data["volume"] = [None]  # Unknown, watertightness was not checked
         if area is not None:
             ui_data["area"] = [area]
 
-        if viewer_type == "pbr":
-            print(f"[PreviewMeshVTK] PBR mode info: watertight={is_watertight}, volume={volume}, area={area}, texture={has_texture}, vertex_colors={has_vertex_colors}")
-        elif viewer_type == "texture":
-            print(f"[PreviewMeshVTK] Texture mode info: watertight={is_watertight}, volume={volume}, area={area}, texture={has_texture}, vertex_colors={has_vertex_colors}")
-        elif field_names:
-            print(f"[PreviewMeshVTK] Fields mode info: watertight={is_watertight}, volume={volume}, area={area}, fields={field_names}")
-        else:
-            print(f"[PreviewMeshVTK] Fields mode info: watertight={is_watertight}, volume={volume}, area={area}, no fields")
+        if VERBOSE:
+            if viewer_type == "pbr":
+                print(f"[PreviewMeshVTK] PBR mode info: watertight={is_watertight}, volume={volume}, area={area}, texture={has_texture}, vertex_colors={has_vertex_colors}")
+            elif viewer_type == "texture":
+                print(f"[PreviewMeshVTK] Texture mode info: watertight={is_watertight}, volume={volume}, area={area}, texture={has_texture}, vertex_colors={has_vertex_colors}")
+            elif field_names:
+                print(f"[PreviewMeshVTK] Fields mode info: watertight={is_watertight}, volume={volume}, area={area}, fields={field_names}")
+            else:
+                print(f"[PreviewMeshVTK] Fields mode info: watertight={is_watertight}, volume={volume}, area={area}, no fields")
+
+        if export_async:
+            # Tells the frontend to wait for /geompack/preview_ready before loading
+            ui_data["mesh_pending"] = [True]
+
+        if preview_key is not None:
+            self._last_key = preview_key
+            self._last_ui = ui_data
+            self._last_path = filepath
 
         return {"ui": ui_data}
 
 
+    def _last_preview_available(self):
+        """True if the last preview file exists or is still being written in the background."""
+        if os.path.exists(self._last_path):
+            return True
+        export_entry = get_pending_export(os.path.basename(self._last_path))
+        return export_entry is not None and not export_entry['ready'].is_set()
+
+    def _export_preview(self, trimesh, filename, filepath, mode, use_vtp):
+        """
+        Write the preview file, falling back to OBJ if the chosen format fails.
+
+        Returns:
+            tuple: (filename, filepath) of the file actually written
+        """
+        try:
+            if mode in ("texture", "texture (PBR)"):
+                # Export GLB for texture/PBR rendering
+                trimesh.export(filepath, file_type='glb', include_normals=True)
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Exported GLB to: {filepath}")
+            elif use_vtp:
+                # Use VTP exporter for fields or point clouds
+                export_mesh_with_scalars_vtp(trimesh, filepath)
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Exported VTP to: {filepath}")
+            elif os.path.exists(filepath):
+                # Identical geometry was already exported
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Reusing STL: {filepath}")
+            else:
+                # Use STL for simple surface meshes; written under a temporary name and
+                # renamed into place so the exists check above never sees a partial file
+                tmp_path = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+                try:
+                    trimesh.export(tmp_path, file_type='stl')
+                    os.replace(tmp_path, filepath)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                if VERBOSE:
+                    print(f"[PreviewMeshVTK] Exported STL to: {filepath}")
+        except Exception as e:
+            print(f"[PreviewMeshVTK] Export failed: {e}")
+            # Fallback to OBJ
+            filename = filename.replace('.vtp', '.obj').replace('.stl', '.obj')
+            filepath = filepath.replace('.vtp', '.obj').replace('.stl', '.obj')
+            trimesh.export(filepath, file_type='obj')
+            print(f"[PreviewMeshVTK] Exported to OBJ: {filepath}")
+
+        return filename, filepath
+
+
 NODE_CLASS_MAPPINGS = {
     "GeomPackPreviewMeshVTK": PreviewMeshVTKNode,
 }
@@ -16,16 +16,42 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
 
+class LogView(list):
+    """
+    Browser console lines with early-exit substring lookups.
+
+    Checks walk the lines and stop at the first match instead of joining
+    everything into one string and rescanning it for every assert.
+    """
+
+    def first_index(self, *substrings, start=0):
+        """Index of the first line containing any of the substrings, or -1."""
+        for i in range(start, len(self)):
+            line = self[i]
+            for s in substrings:
+                if line.find(s) != -1:
+                    return i
+        return -1
+
+    def contains(self, *substrings):
+        """True if any line contains any of the substrings."""
+        return self.first_index(*substrings) != -1
+
+
 @pytest.fixture(scope="session")
 def comfyui_url():
     """Base URL for ComfyUI server. Override with --comfyui-url option."""
     return os.environ.get("COMFYUI_URL", "http://localhost:8188")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def browser(request, comfyui_url):
     """
-    Create a Selenium WebDriver instance for browser testing.
+    Create a Selenium WebDriver instance shared by the whole test session.
+
+    Browser startup dominates short tests, so the driver is created once and
+    each test only navigates (see viewer_page). Under pytest-xdist every
+    worker process gets its own session and therefore its own driver.
 
     Supports Chrome, Safari, and Firefox. Chrome is the default.
     Use --headed flag to run with visible browser (default is headless).
@@ -73,50 +99,33 @@ def browser(request, comfyui_url):
 
     yield driver
 
-    # Teardown: capture screenshot on failure
-    if request.node.rep_call.failed:
-        screenshot_dir = "test-screenshots"
-        os.makedirs(screenshot_dir, exist_ok=True)
-        screenshot_path = os.path.join(
-            screenshot_dir,
-            f"{request.node.name}_{int(time.time())}.png"
-        )
-        driver.save_screenshot(screenshot_path)
-        print(f"\n📸 Screenshot saved: {screenshot_path}")
-
-        # Capture browser console logs
-        try:
-            logs = driver.get_log("browser")
-            log_path = os.path.join(
-                screenshot_dir,
-                f"{request.node.name}_{int(time.time())}_console.log"
-            )
-            with open(log_path, "w") as f:
-                for log in logs:
-                    f.write(f"[{log['level']}] {log['message']}\n")
-            print(f"📝 Console logs saved: {log_path}")
-        except Exception as e:
-            print(f"⚠️  Could not capture console logs: {e}")
-
     driver.quit()
 
 
 @pytest.fixture
-def viewer_page(browser, comfyui_url):
+def viewer_page(request, browser, comfyui_url):
     """
     Load a VTK viewer page and return helper methods for interacting with it.
+
+    The driver is shared across tests; state left by the previous test
+    (cookies, storage, pending console logs, loaded mesh) is cleared here.
     """
     class ViewerPage:
         def __init__(self, driver, base_url):
             self.driver = driver
             self.base_url = base_url
+            self._log_buffer = LogView()
+            self._logs_current = False  # True until the page is driven again after a drain
 
         def load_viewer(self, viewer_name="viewer_vtk.html"):
             """Load a specific VTK viewer HTML file."""
             url = f"{self.base_url}/extensions/ComfyUI-GeometryPack/{viewer_name}"
             print(f"🌐 Loading viewer: {url}")
+            self.clear_logs()
             self.driver.get(url)
-            time.sleep(2)  # Wait for vtk.js to initialize
+            self._logs_current = False
+            # Every viewer logs "[...] Ready" once vtk.js is initialized
+            self.wait_for_log("] Ready", timeout=10)
 
         def send_load_mesh_message(self, filename, file_type="output", subfolder=""):
             """Send a LOAD_MESH postMessage to the viewer (simulating ComfyUI)."""
@@ -130,16 +139,75 @@ def viewer_page(browser, comfyui_url):
             """
             print(f"📤 Sending LOAD_MESH message: {filepath}")
             self.driver.execute_script(script)
-            time.sleep(2)  # Wait for mesh to load
+            self._logs_current = False
+
+        def send_load_mesh_batch(self, filenames, file_type="output", subfolder=""):
+            """Send several LOAD_MESH postMessages in a single execute_script round-trip."""
+            filepaths = [
+                f"/view?filename={filename}&type={file_type}&subfolder={subfolder}"
+                for filename in filenames
+            ]
+            script = """
+                for (const filepath of arguments[0]) {
+                    window.postMessage({
+                        type: 'LOAD_MESH',
+                        filepath: filepath,
+                        timestamp: Date.now()
+                    }, '*');
+                }
+            """
+            print(f"📤 Sending {len(filepaths)} LOAD_MESH messages: {filepaths}")
+            self.driver.execute_script(script, filepaths)
+            self._logs_current = False
 
-        def get_console_logs(self):
-            """Get browser console logs."""
+        def _drain(self):
+            """Move new browser log entries into the local buffer (WebDriver clears them on read)."""
             try:
                 logs = self.driver.get_log("browser")
-                return [f"[{log['level']}] {log['message']}" for log in logs]
             except Exception as e:
                 print(f"⚠️  Could not get console logs: {e}")
-                return []
+                return
+            self._log_buffer.extend(f"[{log['level']}] {log['message']}" for log in logs)
+            self._logs_current = True
+
+        def drain_logs(self):
+            """Fetch new browser console entries and return everything collected so far."""
+            self._drain()
+            return LogView(self._log_buffer)
+
+        def clear_logs(self):
+            """Discard pending and collected console logs."""
+            self._drain()
+            self._log_buffer.clear()
+
+        def get_console_logs(self):
+            """
+            Get browser console logs collected so far.
+
+            Only asks WebDriver for new entries if the page was driven since the
+            last drain, so several asserts can share one fetch.
+            """
+            if not self._logs_current:
+                self._drain()
+            return LogView(self._log_buffer)
+
+        def wait_for_console(self, predicate, timeout=2.5, interval=0.05):
+            """
+            Poll the browser console until predicate(logs) is true.
+
+            Returns the collected log lines as soon as the predicate holds, or
+            once the timeout expires so the caller's asserts report what was logged.
+            """
+            deadline = time.monotonic() + timeout
+            while True:
+                self._drain()
+                if predicate(self._log_buffer) or time.monotonic() >= deadline:
+                    return LogView(self._log_buffer)
+                time.sleep(interval)
+
+        def wait_for_log(self, *substrings, timeout=2.5, interval=0.05):
+            """Poll the browser console until a line contains any of the given substrings."""
+            return self.wait_for_console(lambda logs: logs.contains(*substrings), timeout, interval)
 
         def wait_for_text(self, text, timeout=10):
             """Wait for specific text to appear on the page."""
@@ -163,7 +231,44 @@ def viewer_page(browser, comfyui_url):
             except NoSuchElementException:
                 return None
 
-    return ViewerPage(browser, comfyui_url)
+    browser.delete_all_cookies()
+    page = ViewerPage(browser, comfyui_url)
+    page.clear_logs()
+
+    yield page
+
+    # Teardown: capture screenshot on failure
+    if request.node.rep_call.failed:
+        screenshot_dir = "test-screenshots"
+        os.makedirs(screenshot_dir, exist_ok=True)
+        screenshot_path = os.path.join(
+            screenshot_dir,
+            f"{request.node.name}_{int(time.time())}.png"
+        )
+        browser.save_screenshot(screenshot_path)
+        print(f"\n📸 Screenshot saved: {screenshot_path}")
+
+        # Capture browser console logs
+        try:
+            logs = page.drain_logs()
+            log_path = os.path.join(
+                screenshot_dir,
+                f"{request.node.name}_{int(time.time())}_console.log"
+            )
+            with open(log_path, "w") as f:
+                for line in logs:
+                    f.write(f"{line}\n")
+            print(f"📝 Console logs saved: {log_path}")
+        except Exception as e:
+            print(f"⚠️  Could not capture console logs: {e}")
+
+    # Leave the shared driver clean for the next test
+    try:
+        browser.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+    except Exception as e:
+        print(f"⚠️  Could not reset viewer state: {e}")
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -190,9 +295,28 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to use for tests (chrome, safari, firefox)"
     )
+    parser.addoption(
+        "--browser-parallel",
+        action="store_true",
+        default=False,
+        help="Run tests across pytest-xdist workers (-n auto), one browser per worker"
+    )
     parser.addoption(
         "--comfyui-url",
         action="store",
         default="http://localhost:8188",
         help="Base URL for ComfyUI server"
     )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Turn --browser-parallel into -n auto when pytest-xdist is installed."""
+    if not config.getoption("--browser-parallel"):
+        return
+    if not config.pluginmanager.hasplugin("xdist"):
+        print("⚠️  --browser-parallel needs pytest-xdist; running serially")
+        return
+    # Each xdist worker is its own process, so the browser fixture gives every worker its own driver
+    if not config.getoption("numprocesses", None):
+        config.option.numprocesses = "auto"
@@ -5,7 +5,9 @@ Tests file format detection, VTP support, and basic mesh loading.
 """
 
 import pytest
-import time
+
+# Lines the viewer logs when a LOAD_MESH request finishes, successfully or not
+LOAD_FINISHED = ("Mesh loaded:", "] Error:")
 
 
 @pytest.mark.browser
@@ -34,28 +36,24 @@ class TestVTKViewer:
         # Send a VTP file load message
         viewer_page.send_load_mesh_message("test_mesh.vtp")
 
-        # Wait a bit for processing
-        time.sleep(2)
-
-        # Get console logs
-        logs = viewer_page.get_console_logs()
-        log_text = "\n".join(logs)
+        # Wait for the load to finish (or fail)
+        logs = viewer_page.wait_for_log(*LOAD_FINISHED)
 
         # Check that VTP is detected
-        assert "VTP" in log_text or ".vtp" in log_text, \
+        assert logs.contains("VTP", ".vtp"), \
                "VTP file format not detected in logs"
 
         # Check that there's NO "Unsupported file format" error
-        assert "Unsupported file format" not in log_text, \
+        assert not logs.contains("Unsupported file format"), \
                "VTP file format still showing as unsupported!"
 
         # Check that VTP reader is mentioned (if loaded successfully)
-        if "VTP (XML PolyData)" in log_text or "VTP" in log_text:
+        if logs.contains("VTP"):
             print("✅ VTP format is recognized")
         else:
             print("⚠️  VTP format detection unclear from logs")
 
-        print(f"\n📝 Console logs:\n{log_text}")
+        print("\n📝 Console logs:\n" + "\n".join(logs))
 
     def test_stl_format_still_works(self, viewer_page):
         """Test that STL files still work after our VTP changes."""
@@ -63,18 +61,14 @@ class TestVTKViewer:
 
         # Send an STL file load message
         viewer_page.send_load_mesh_message("test_mesh.stl")
-        time.sleep(2)
-
-        # Get console logs
-        logs = viewer_page.get_console_logs()
-        log_text = "\n".join(logs)
+        logs = viewer_page.wait_for_log(*LOAD_FINISHED)
 
         # Check that STL is detected
-        assert "STL" in log_text or ".stl" in log_text, \
+        assert logs.contains("STL", ".stl"), \
                "STL file format not detected"
 
         # Check that there's no unsupported format error
-        assert "Unsupported file format" not in log_text, \
+        assert not logs.contains("Unsupported file format"), \
                "STL files broken after VTP changes"
 
         print("✅ STL format still works")
@@ -85,18 +79,14 @@ class TestVTKViewer:
 
         # Send an OBJ file load message
         viewer_page.send_load_mesh_message("test_mesh.obj")
-        time.sleep(2)
-
-        # Get console logs
-        logs = viewer_page.get_console_logs()
-        log_text = "\n".join(logs)
+        logs = viewer_page.wait_for_log(*LOAD_FINISHED)
 
         # Check that OBJ is detected
-        assert "OBJ" in log_text or ".obj" in log_text, \
+        assert logs.contains("OBJ", ".obj"), \
                "OBJ file format not detected"
 
         # Check that there's no unsupported format error
-        assert "Unsupported file format" not in log_text, \
+        assert not logs.contains("Unsupported file format"), \
                "OBJ files broken after VTP changes"
 
         print("✅ OBJ format still works")
@@ -107,14 +97,10 @@ class TestVTKViewer:
 
         # Send an unsupported file format
         viewer_page.send_load_mesh_message("test_mesh.fbx")
-        time.sleep(2)
-
-        # Get console logs
-        logs = viewer_page.get_console_logs()
-        log_text = "\n".join(logs)
+        logs = viewer_page.wait_for_log(*LOAD_FINISHED)
 
         # Should show unsupported format error for FBX
-        assert "Unsupported file format" in log_text or "supports STL, OBJ, and VTP" in log_text, \
+        assert logs.contains("Unsupported file format", "supports STL, OBJ, and VTP"), \
                "Unsupported format (FBX) did not trigger error message"
 
         print("✅ Unsupported formats correctly rejected")
@@ -137,22 +123,66 @@ class TestVTKViewer:
             }, '*');
         """
         viewer_page.driver.execute_script(script)
-        time.sleep(2)
-
-        # Get console logs
-        logs = viewer_page.get_console_logs()
-        log_text = "\n".join(logs)
+        logs = viewer_page.wait_for_log(*LOAD_FINISHED)
 
         # The .vtp extension should be detected even with query params
-        assert ".vtp" in log_text, \
+        assert logs.contains(".vtp"), \
                "VTP extension not detected in query string URL"
 
         # Should not show unsupported format error
-        assert "Unsupported file format" not in log_text, \
+        assert not logs.contains("Unsupported file format"), \
                "VTP file in query string URL not recognized"
 
         print("✅ File format detection works with query string URLs")
 
+    def test_format_detection_matrix(self, viewer_page):
+        """Test format detection for several files sent as LOAD_MESH messages in one round-trip."""
+        viewer_page.load_viewer("viewer_vtk.html")
+
+        # filename -> whether the viewer should accept the format
+        expected = {
+            "mesh1.vtp": True,
+            "mesh2.stl": True,
+            "mesh3.obj": True,
+            "mesh4.fbx": False,
+            "preview_vtk_fields_abc123.vtp": True,
+        }
+        viewer_page.send_load_mesh_batch(list(expected))
+        logs = viewer_page.wait_for_console(
+            lambda lines: sum(any(s in line for s in LOAD_FINISHED) for line in lines) >= len(expected)
+        )
+
+        # Format detection runs before the first await in loadMeshFile, so a rejected
+        # format logs its error on the line right after its "Loading:" line
+        results = {}
+        for filename in expected:
+            i = next((i for i, line in enumerate(logs)
+                      if "Loading:" in line and f"filename={filename}&" in line), -1)
+            assert i != -1, f"{filename} was not picked up from the batched messages"
+            results[filename] = not (i + 1 < len(logs) and "Unsupported format" in logs[i + 1])
+
+        assert results == expected, \
+               f"Unexpected format detection results: {results}"
+
+        print("✅ Format detection matrix passed")
+
+    def test_batched_load_messages(self, viewer_page):
+        """Test that several LOAD_MESH messages posted at once are all picked up."""
+        viewer_page.load_viewer("viewer_vtk.html")
+
+        filenames = ["test_mesh.vtp", "test_mesh.stl", "test_mesh.obj"]
+        viewer_page.send_load_mesh_batch(filenames)
+        logs = viewer_page.wait_for_console(
+            lambda lines: sum(any(s in line for s in LOAD_FINISHED) for line in lines) >= len(filenames)
+        )
+
+        # Each format should have reached the loader
+        for filename in filenames:
+            assert logs.contains(filename), \
+                   f"{filename} was not picked up from the batched messages"
+
+        print("✅ Batched LOAD_MESH messages handled")
+
     def test_controls_present(self, viewer_page):
         """Test that viewer controls are present."""
         viewer_page.load_viewer("viewer_vtk.html")
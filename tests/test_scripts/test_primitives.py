@@ -4,15 +4,20 @@ import pytest
 from nodes.primitives import CreatePrimitive
 
 
+@pytest.fixture(scope="module")
+def primitive_node():
+    """Single CreatePrimitive instance shared by the tests in this module."""
+    return CreatePrimitive()
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("shape,expected_verts", [
     ("cube", 8),
     ("plane", 4),
 ])
-def test_create_primitive_shapes(shape, expected_verts, render_helper, save_mesh_helper):
+def test_create_primitive_shapes(shape, expected_verts, primitive_node, render_helper, save_mesh_helper):
     """Test creating different primitive shapes."""
-    node = CreatePrimitive()
-    mesh = node.create_primitive(shape=shape, size=1.0)[0]
+    mesh = primitive_node.create_primitive(shape=shape, size=1.0)[0]
 
     assert mesh is not None
     assert mesh.vertices.shape[0] >= expected_verts
@@ -24,10 +29,9 @@ def test_create_primitive_shapes(shape, expected_verts, render_helper, save_mesh
 
 
 @pytest.mark.unit
-def test_create_sphere(render_helper, save_mesh_helper):
+def test_create_sphere(primitive_node, render_helper, save_mesh_helper):
     """Test creating sphere primitive."""
-    node = CreatePrimitive()
-    mesh = node.create_primitive(shape="sphere", size=1.0)[0]
+    mesh = primitive_node.create_primitive(shape="sphere", size=1.0)[0]
 
     assert mesh is not None
     assert mesh.vertices.shape[0] > 10
@@ -40,11 +44,10 @@ def test_create_sphere(render_helper, save_mesh_helper):
 
 
 @pytest.mark.unit
-def test_create_primitive_with_subdivisions(render_helper, save_mesh_helper):
+def test_create_primitive_with_subdivisions(primitive_node, render_helper, save_mesh_helper):
     """Test creating primitive with subdivisions."""
-    node = CreatePrimitive()
-    mesh_sub0 = node.create_primitive(shape="sphere", size=1.0, subdivisions=0)[0]
-    mesh_sub2 = node.create_primitive(shape="sphere", size=1.0, subdivisions=2)[0]
+    mesh_sub0 = primitive_node.create_primitive(shape="sphere", size=1.0, subdivisions=0)[0]
+    mesh_sub2 = primitive_node.create_primitive(shape="sphere", size=1.0, subdivisions=2)[0]
 
     assert mesh_sub2.vertices.shape[0] > mesh_sub0.vertices.shape[0]
 
@@ -54,10 +57,9 @@ def test_create_primitive_with_subdivisions(render_helper, save_mesh_helper):
 
 @pytest.mark.unit
 @pytest.mark.parametrize("size", [0.5, 1.0, 2.0])
-def test_create_primitive_sizes(size):
+def test_create_primitive_sizes(size, primitive_node):
     """Test creating primitives with different sizes."""
-    node = CreatePrimitive()
-    mesh = node.create_primitive(shape="cube", size=size)[0]
+    mesh = primitive_node.create_primitive(shape="cube", size=size)[0]
 
     bounds = mesh.bounds
     extent = bounds[1] - bounds[0]
@@ -1,9 +1,11 @@
 """Tests for visualization nodes."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 from nodes.visualization import (
     PreviewMeshNode,
+    PreviewMeshDualNode,
     PreviewMeshVTKNode,
     PreviewMeshVTKFiltersNode,
     PreviewMeshVTKFieldsNode,
@@ -67,3 +69,22 @@ def test_preview_mesh_vtk_fields(sphere_mesh, meshes_output_dir):
     # Verify VTP file was created (supports fields) in the ComfyUI output folder
     vtp_files = list(meshes_output_dir.rglob("*.vtp"))
     assert len(vtp_files) > 0
+
+
+@pytest.mark.unit
+def test_preview_mesh_dual_overlay_face_fields(cube_mesh, sphere_mesh, meshes_output_dir):
+    """Test that a face field shared by both meshes survives the overlay export."""
+    cube_mesh.face_attributes['quality'] = np.arange(len(cube_mesh.faces), dtype=np.float32)
+    sphere_mesh.face_attributes['quality'] = np.zeros(len(sphere_mesh.faces), dtype=np.float32)
+
+    node = PreviewMeshDualNode()
+    result = node.preview_dual(mesh_1=cube_mesh, mesh_2=sphere_mesh, layout="overlay")
+
+    ui = result["ui"]
+    assert "face.quality" in ui["common_fields"][0]
+
+    # The advertised face field must be present in the exported VTP's cell data
+    vtp_path = meshes_output_dir / ui["mesh_file"][0]
+    header = vtp_path.read_bytes().split(b"<AppendedData")[0]
+    cell_data = header.split(b"<CellData")[1].split(b"</CellData>")[0]
+    assert b'Name="quality"' in cell_data
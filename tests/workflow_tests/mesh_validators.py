@@ -15,33 +15,112 @@ class MeshValidator:
     """Validates mesh geometry and topology."""
 
     @staticmethod
-    def is_valid_mesh(mesh):
+    def _collect(mesh):
         """
-        Check if a mesh has valid basic geometry.
+        Gather the arrays and sizes the checks read, once per mesh.
 
         Args:
             mesh: trimesh.Trimesh object
 
         Returns:
-            tuple: (is_valid, error_message)
+            dict: Check context shared by the _check helpers
         """
         if not isinstance(mesh, trimesh.Trimesh):
-            return False, f"Not a Trimesh object: {type(mesh)}"
+            return {'mesh': mesh, 'is_trimesh': False}
+
+        vertices = np.asarray(mesh.vertices)
+        faces = np.asarray(mesh.faces)
+        return {
+            'mesh': mesh,
+            'is_trimesh': True,
+            'vertices': vertices,
+            'faces': faces,
+            'num_vertices': vertices.shape[0],
+            'num_faces': faces.shape[0],
+        }
+
+    @staticmethod
+    def _is_valid_mesh(ctx):
+        if not ctx['is_trimesh']:
+            return False, f"Not a Trimesh object: {type(ctx['mesh'])}"
 
-        if len(mesh.vertices) == 0:
+        if ctx['num_vertices'] == 0:
             return False, "Mesh has no vertices"
 
-        if len(mesh.faces) == 0:
+        if ctx['num_faces'] == 0:
             return False, "Mesh has no faces"
 
-        if np.any(np.isnan(mesh.vertices)):
-            return False, "Mesh contains NaN vertices"
+        # A single sum is finite for all-finite vertices; only build masks to explain a failure
+        # (the sum can also overflow for huge but finite coordinates, which the masks rule out)
+        vertices = ctx['vertices']
+        with np.errstate(over='ignore', invalid='ignore'):
+            total = vertices.sum()
+        if not np.isfinite(total):
+            if np.isnan(vertices).any():
+                return False, "Mesh contains NaN vertices"
+
+            if np.isinf(vertices).any():
+                return False, "Mesh contains infinite vertices"
+
+        return True, None
+
+    @staticmethod
+    def _check_vertex_count(ctx, min_vertices=3, max_vertices=None):
+        count = ctx['num_vertices']
+
+        if count < min_vertices:
+            return False, f"Too few vertices: {count} < {min_vertices}"
+
+        if max_vertices and count > max_vertices:
+            return False, f"Too many vertices: {count} > {max_vertices}"
+
+        return True, None
+
+    @staticmethod
+    def _check_face_count(ctx, min_faces=1, max_faces=None):
+        count = ctx['num_faces']
+
+        if count < min_faces:
+            return False, f"Too few faces: {count} < {min_faces}"
+
+        if max_faces and count > max_faces:
+            return False, f"Too many faces: {count} > {max_faces}"
+
+        return True, None
+
+    @staticmethod
+    def _check_bounding_box(ctx, expected_min=None, expected_max=None, tolerance=0.1):
+        bounds = ctx['mesh'].bounds
+
+        # Compare both corners in one pass; an unspecified corner is compared against itself.
+        # Row assignment converts lists/tuples/arrays straight into bounds' dtype
+        expected = bounds.copy()
+        if expected_min is not None:
+            expected[0] = expected_min
+        if expected_max is not None:
+            expected[1] = expected_max
+        mismatch = np.abs(bounds - expected) > tolerance
 
-        if np.any(np.isinf(mesh.vertices)):
-            return False, "Mesh contains infinite vertices"
+        if mismatch.any():
+            if mismatch[0].any():
+                return False, f"Bounds min mismatch: {bounds[0]} vs {expected_min}"
+            return False, f"Bounds max mismatch: {bounds[1]} vs {expected_max}"
 
         return True, None
 
+    @staticmethod
+    def is_valid_mesh(mesh):
+        """
+        Check if a mesh has valid basic geometry.
+
+        Args:
+            mesh: trimesh.Trimesh object
+
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        return MeshValidator._is_valid_mesh(MeshValidator._collect(mesh))
+
     @staticmethod
     def check_vertex_count(mesh, min_vertices=3, max_vertices=None):
         """
@@ -55,15 +134,7 @@ class MeshValidator:
         Returns:
             tuple: (is_valid, error_message)
         """
-        count = len(mesh.vertices)
-
-        if count < min_vertices:
-            return False, f"Too few vertices: {count} < {min_vertices}"
-
-        if max_vertices and count > max_vertices:
-            return False, f"Too many vertices: {count} > {max_vertices}"
-
-        return True, None
+        return MeshValidator._check_vertex_count(MeshValidator._collect(mesh), min_vertices, max_vertices)
 
     @staticmethod
     def check_face_count(mesh, min_faces=1, max_faces=None):
@@ -78,15 +149,7 @@ class MeshValidator:
         Returns:
             tuple: (is_valid, error_message)
         """
-        count = len(mesh.faces)
-
-        if count < min_faces:
-            return False, f"Too few faces: {count} < {min_faces}"
-
-        if max_faces and count > max_faces:
-            return False, f"Too many faces: {count} > {max_faces}"
-
-        return True, None
+        return MeshValidator._check_face_count(MeshValidator._collect(mesh), min_faces, max_faces)
 
     @staticmethod
     def check_manifold(mesh):
@@ -100,6 +163,8 @@ class MeshValidator:
             tuple: (is_manifold, error_message)
         """
         try:
+            # trimesh memoises is_watertight on the mesh and drops it when the mesh is edited,
+            # so repeated checks of the same mesh reuse the edge-adjacency result
             is_manifold = mesh.is_watertight
             if not is_manifold:
                 return False, "Mesh is not watertight/manifold"
@@ -114,28 +179,16 @@ class MeshValidator:
 
         Args:
             mesh: trimesh.Trimesh object
-            expected_min: Expected minimum bounds (x, y, z)
-            expected_max: Expected maximum bounds (x, y, z)
+            expected_min: Expected minimum bounds (x, y, z), as a list, tuple or array
+            expected_max: Expected maximum bounds (x, y, z), as a list, tuple or array
             tolerance: Tolerance for comparison
 
         Returns:
             tuple: (is_valid, error_message)
         """
-        bounds = mesh.bounds
-        actual_min = bounds[0]
-        actual_max = bounds[1]
-
-        if expected_min is not None:
-            diff = np.abs(actual_min - np.array(expected_min))
-            if np.any(diff > tolerance):
-                return False, f"Bounds min mismatch: {actual_min} vs {expected_min}"
-
-        if expected_max is not None:
-            diff = np.abs(actual_max - np.array(expected_max))
-            if np.any(diff > tolerance):
-                return False, f"Bounds max mismatch: {actual_max} vs {expected_max}"
-
-        return True, None
+        return MeshValidator._check_bounding_box(
+            MeshValidator._collect(mesh), expected_min, expected_max, tolerance
+        )
 
     @staticmethod
     def check_has_uv_coordinates(mesh):
@@ -177,11 +230,30 @@ class MeshValidator:
 
         return True, None
 
+    # Default checks for validate_all, resolved once: (name, context check)
+    _BASIC_CHECKS = (
+        ('is_valid_mesh', _is_valid_mesh.__func__),
+        ('check_vertex_count', _check_vertex_count.__func__),
+        ('check_face_count', _check_face_count.__func__),
+    )
+
+    # Checks validate_all can run with only the mesh; the others need extra arguments
+    _SINGLE_ARG_CHECKS = frozenset({
+        'is_valid_mesh',
+        'check_vertex_count',
+        'check_face_count',
+        'check_manifold',
+        'check_bounding_box',
+        'check_has_uv_coordinates',
+    })
+
     @classmethod
     def validate_all(cls, mesh, checks=None):
         """
         Run all specified validation checks on a mesh.
 
+        Checks that need arguments beyond the mesh are skipped.
+
         Args:
             mesh: trimesh.Trimesh object
             checks: List of check names to run (None = run basic checks)
@@ -189,27 +261,41 @@ class MeshValidator:
         Returns:
             tuple: (all_valid, list of error messages)
         """
-        if checks is None:
-            checks = ['is_valid_mesh', 'check_vertex_count', 'check_face_count']
-
         errors = []
 
+        # Read the mesh arrays once and share them between the checks
+        ctx = cls._collect(mesh)
+        if not ctx['is_trimesh']:
+            return False, [f"Not a Trimesh object: {type(mesh)}"]
+
+        if checks is None:
+            for check_name, check_method in cls._BASIC_CHECKS:
+                _run_check(check_name, check_method, ctx, errors)
+            return len(errors) == 0, errors
+
         for check_name in checks:
             if not hasattr(cls, check_name):
                 errors.append(f"Unknown check: {check_name}")
                 continue
 
-            check_method = getattr(cls, check_name)
-
-            try:
-                # Call with just mesh for basic checks
-                is_valid, error = check_method(mesh)
-                if not is_valid:
-                    errors.append(f"{check_name}: {error}")
-            except TypeError:
+            if check_name not in cls._SINGLE_ARG_CHECKS:
                 # Check requires additional parameters, skip
                 continue
-            except Exception as e:
-                errors.append(f"{check_name} raised exception: {e}")
+
+            # Prefer the context variant of a check so the mesh arrays are shared
+            ctx_method = getattr(cls, f"_{check_name}", None)
+            check_method = ctx_method if ctx_method is not None else getattr(cls, check_name)
+
+            _run_check(check_name, check_method, ctx if ctx_method is not None else mesh, errors)
 
         return len(errors) == 0, errors
+
+
+def _run_check(check_name, check_method, arg, errors):
+    """Run one check on a mesh or its context, appending any failure to errors."""
+    try:
+        is_valid, error = check_method(arg)
+        if not is_valid:
+            errors.append(f"{check_name}: {error}")
+    except Exception as e:
+        errors.append(f"{check_name} raised exception: {e}")
@@ -8,7 +8,12 @@ These tests execute actual workflow JSON files through the ComfyUI API
 and validate their outputs.
 """
 
+import functools
+import json
+
+import numpy as np
 import pytest
+import trimesh
 from pathlib import Path
 from .workflow_executor import WorkflowExecutor
 from .mesh_validators import MeshValidator
@@ -23,6 +28,23 @@ SIMPLE_WORKFLOWS = [
     "transform.json",
 ]
 
+# Stat the workflow files once at collection instead of in every test
+_EXISTING = {name: (WORKFLOWS_DIR / name).exists() for name in SIMPLE_WORKFLOWS}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_workflow(path_str):
+    """Parse a workflow JSON file once; later tests reuse the dictionary."""
+    return json.loads(Path(path_str).read_text())
+
+
+def _workflow_or_skip(workflow_file):
+    """Return the parsed workflow, skipping the test if the file is missing."""
+    workflow_path = WORKFLOWS_DIR / workflow_file
+    if not _EXISTING[workflow_file]:
+        pytest.skip(f"Workflow file not found: {workflow_path}")
+    return _load_workflow(str(workflow_path))
+
 
 @pytest.fixture(scope="module")
 def workflow_executor():
@@ -51,14 +73,11 @@ def test_simple_workflow_execution(workflow_executor, workflow_file):
         workflow_executor: WorkflowExecutor fixture
         workflow_file: Workflow JSON filename
     """
-    workflow_path = WORKFLOWS_DIR / workflow_file
-
-    if not workflow_path.exists():
-        pytest.skip(f"Workflow file not found: {workflow_path}")
+    workflow = _workflow_or_skip(workflow_file)
 
     # Execute workflow
     try:
-        outputs = workflow_executor.execute_workflow_file(str(workflow_path), timeout=120)
+        outputs = workflow_executor.execute_workflow_dict(workflow, timeout=120)
     except Exception as e:
         pytest.fail(f"Workflow execution failed: {e}")
 
@@ -76,12 +95,9 @@ def test_preview_mesh_workflow(workflow_executor):
     Workflow: LoadMesh → PreviewMesh
     Expected: Mesh loads and preview node executes
     """
-    workflow_path = WORKFLOWS_DIR / "preview_mesh.json"
+    workflow = _workflow_or_skip("preview_mesh.json")
 
-    if not workflow_path.exists():
-        pytest.skip(f"Workflow file not found: {workflow_path}")
-
-    outputs = workflow_executor.execute_workflow_file(str(workflow_path), timeout=60)
+    outputs = workflow_executor.execute_workflow_dict(workflow, timeout=60)
 
     # Check outputs exist
     assert outputs is not None
@@ -100,12 +116,9 @@ def test_transform_workflow(workflow_executor):
     Workflow: CreatePrimitive → TransformMesh → PreviewMeshDual
     Expected: Primitive created, transformed, and previewed
     """
-    workflow_path = WORKFLOWS_DIR / "transform.json"
-
-    if not workflow_path.exists():
-        pytest.skip(f"Workflow file not found: {workflow_path}")
+    workflow = _workflow_or_skip("transform.json")
 
-    outputs = workflow_executor.execute_workflow_file(str(workflow_path), timeout=60)
+    outputs = workflow_executor.execute_workflow_dict(workflow, timeout=60)
 
     # Check outputs exist
     assert outputs is not None
@@ -121,29 +134,29 @@ def test_side_by_side_viewer_workflow(workflow_executor):
     Workflow: CreatePrimitive → PreviewMeshDual
     Expected: Primitive created and displayed in dual viewer
     """
-    workflow_path = WORKFLOWS_DIR / "side_by_side_viewer.json"
-
-    if not workflow_path.exists():
-        pytest.skip(f"Workflow file not found: {workflow_path}")
+    workflow = _workflow_or_skip("side_by_side_viewer.json")
 
-    outputs = workflow_executor.execute_workflow_file(str(workflow_path), timeout=60)
+    outputs = workflow_executor.execute_workflow_dict(workflow, timeout=60)
 
     # Check outputs exist
     assert outputs is not None
     assert len(outputs) > 0, "No outputs from side_by_side_viewer workflow"
 
 
+@pytest.fixture(scope="module")
+def _triangle_mesh():
+    """Single-triangle mesh shared by the validator tests (copy before mutating)."""
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    faces = np.array([[0, 1, 2]])
+    return trimesh.Trimesh(vertices=vertices, faces=faces)
+
+
 # Validation helper tests (can be used for debugging)
 @pytest.mark.unit
-def test_mesh_validator_basic():
+def test_mesh_validator_basic(_triangle_mesh):
     """Test MeshValidator basic functionality."""
-    import trimesh
-    import numpy as np
-
-    # Create a simple valid mesh
-    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
-    faces = np.array([[0, 1, 2]])
-    mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+    # A simple valid mesh
+    mesh = _triangle_mesh
 
     # Should pass validation
     is_valid, error = MeshValidator.is_valid_mesh(mesh)
@@ -159,15 +172,10 @@ def test_mesh_validator_basic():
 
 
 @pytest.mark.unit
-def test_mesh_validator_invalid():
+def test_mesh_validator_invalid(_triangle_mesh):
     """Test MeshValidator with invalid meshes."""
-    import trimesh
-    import numpy as np
-
-    # Create a valid mesh first
-    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
-    faces = np.array([[0, 1, 2]])
-    mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+    # Start from a copy of the valid mesh
+    mesh = _triangle_mesh.copy()
 
     # Now manually inject NaN (trimesh may clean it during construction)
     mesh.vertices[1, 0] = np.nan
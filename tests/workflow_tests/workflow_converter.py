@@ -8,8 +8,18 @@ Converts ComfyUI UI workflow JSON format to the API prompt format
 required by the ComfyUI server.
 """
 
+import copy
+import functools
+import itertools
 import json
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, Iterable, List
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class WorkflowConverter:
@@ -26,56 +36,57 @@ class WorkflowConverter:
         Returns:
             Dict in API format (node IDs as keys)
         """
+        link_map = WorkflowConverter._build_link_map(workflow_json.get('links', ()))
+        return WorkflowConverter._convert_nodes(workflow_json.get('nodes', ()), link_map)
+
+    @staticmethod
+    def _build_link_map(links: Iterable[List[Any]]) -> Dict[Any, Any]:
+        """Link lookup table: link_id -> (source_node_id_str, source_output_slot)."""
+        # Link format: [link_id, source_node, source_slot, dest_node, dest_slot, type]
+        return {link[0]: (str(link[1]), link[2]) for link in links}
+
+    @staticmethod
+    def _convert_nodes(nodes: Iterable[Dict[str, Any]], link_map: Dict[Any, Any]) -> Dict[str, Any]:
+        """Convert UI nodes to API prompt entries."""
         api_prompt = {}
 
-        # Build link lookup table: link_id -> (source_node, source_output_slot)
-        link_map = {}
-        for link in workflow_json.get('links', []):
-            # Link format: [link_id, source_node, source_slot, dest_node, dest_slot, type]
-            link_id = link[0]
-            source_node = link[1]
-            source_slot = link[2]
-            link_map[link_id] = (source_node, source_slot)
-
-        # Convert each node
-        for node in workflow_json.get('nodes', []):
-            node_id = str(node['id'])
-            node_type = node['type']
-
-            api_node = {
-                'class_type': node_type,
-                'inputs': {}
-            }
+        # Convert each node, reading each node field once
+        for node in nodes:
+            node_inputs = {}
 
-            # Process input connections (from links)
-            for input_def in node.get('inputs', []):
+            # Process input connections (from links) and collect the unlinked
+            # input names in the same pass - those are the widget inputs
+            widget_input_names = []
+            for input_def in node.get('inputs') or ():
                 input_name = input_def['name']
                 link_id = input_def.get('link')
 
-                if link_id is not None and link_id in link_map:
+                if link_id is None:
+                    widget_input_names.append(input_name)
+                elif link_id in link_map:
                     source_node, source_slot = link_map[link_id]
-                    api_node['inputs'][input_name] = [str(source_node), source_slot]
+                    node_inputs[input_name] = [source_node, source_slot]
 
             # Process widget values (direct inputs)
-            widget_values = node.get('widgets_values', [])
-            if widget_values:
-                # Map widget values to input names
-                # This requires knowing the node's INPUT_TYPES, but we'll use a heuristic:
-                # Get input names that don't have links (they're widget inputs)
-                linked_inputs = set(inp['name'] for inp in node.get('inputs', []) if inp.get('link') is not None)
-
-                # Try to map widget values to non-linked inputs by order
-                widget_input_names = [inp['name'] for inp in node.get('inputs', []) if inp['name'] not in linked_inputs]
-
-                for i, widget_value in enumerate(widget_values):
-                    if i < len(widget_input_names):
-                        api_node['inputs'][widget_input_names[i]] = widget_value
-                    else:
-                        # If we have more widget values than expected inputs,
-                        # use generic names (this might not work perfectly)
-                        api_node['inputs'][f'widget_{i}'] = widget_value
-
-            api_prompt[node_id] = api_node
+            # Map widget values to input names
+            # This requires knowing the node's INPUT_TYPES, but we'll use a heuristic:
+            # map widget values to the non-linked inputs by order
+            widget_values = node.get('widgets_values') or ()
+            for input_name, widget_value in zip(widget_input_names, widget_values):
+                node_inputs[input_name] = widget_value
+
+            num_widget_inputs = len(widget_input_names)
+            if len(widget_values) > num_widget_inputs:
+                # If we have more widget values than expected inputs,
+                # use generic names (this might not work perfectly)
+                overflow = itertools.islice(widget_values, num_widget_inputs, None)
+                for i, widget_value in enumerate(overflow, num_widget_inputs):
+                    node_inputs[f'widget_{i}'] = widget_value
+
+            api_prompt[str(node['id'])] = {
+                'class_type': node['type'],
+                'inputs': node_inputs
+            }
 
         return api_prompt
 
@@ -90,6 +101,10 @@ class WorkflowConverter:
         Returns:
             Workflow dictionary
         """
+        if ORJSON_AVAILABLE:
+            with open(workflow_path, 'rb') as f:
+                return orjson.loads(f.read())
+
         with open(workflow_path, 'r') as f:
             return json.load(f)
 
@@ -102,9 +117,22 @@ class WorkflowConverter:
             api_prompt: API format prompt
             output_path: Output file path
         """
+        if ORJSON_AVAILABLE:
+            # orjson returns bytes
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(api_prompt, option=orjson.OPT_INDENT_2))
+            return
+
         with open(output_path, 'w') as f:
             json.dump(api_prompt, f, indent=2)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _convert_cached(workflow_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Convert a workflow file; mtime_ns and size only serve as cache key."""
+        workflow = WorkflowConverter.load_workflow(workflow_path)
+        return WorkflowConverter.convert_to_api_format(workflow)
+
     @classmethod
     def convert_workflow_file(cls, workflow_path: str, output_path: str = None) -> Dict[str, Any]:
         """
@@ -115,10 +143,13 @@ class WorkflowConverter:
             output_path: Optional path to save API format
 
         Returns:
-            API format prompt
+            API format prompt (a copy, so callers may modify it)
         """
-        workflow = cls.load_workflow(workflow_path)
-        api_prompt = cls.convert_to_api_format(workflow)
+        # Key on mtime and size so an edited file is converted again
+        stat = os.stat(workflow_path)
+        api_prompt = copy.deepcopy(
+            cls._convert_cached(os.path.abspath(workflow_path), stat.st_mtime_ns, stat.st_size)
+        )
 
         if output_path:
             cls.save_api_prompt(api_prompt, output_path)
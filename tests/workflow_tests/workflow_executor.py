@@ -22,6 +22,23 @@ try:
 except ImportError:
     WEBSOCKET_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+
+# orjson decodes the (possibly large) history payloads noticeably faster
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class WorkflowExecutor:
     """Executes ComfyUI workflows via the server API."""
@@ -34,8 +51,23 @@ class WorkflowExecutor:
             server_address: ComfyUI server address (host:port)
         """
         self.server_address = server_address
-        self.client_id = str(uuid.uuid4())
+        self._client_id = None
         self.ws = None
+        self.session = None
+
+    @property
+    def client_id(self):
+        """Websocket client id, generated on first use."""
+        if self._client_id is None:
+            self._client_id = uuid.uuid4().hex
+        return self._client_id
+
+    def _http_session(self):
+        """Persistent HTTP session (keep-alive) for API calls, or None without requests."""
+        if self.session is None and REQUESTS_AVAILABLE:
+            self.session = requests.Session()
+            self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        return self.session
 
     def connect(self):
         """Connect to ComfyUI websocket for real-time updates."""
@@ -47,10 +79,13 @@ class WorkflowExecutor:
         self.ws.connect(ws_url)
 
     def disconnect(self):
-        """Disconnect from ComfyUI websocket."""
+        """Disconnect from ComfyUI websocket and close the HTTP session."""
         if self.ws:
             self.ws.close()
             self.ws = None
+        if self.session:
+            self.session.close()
+            self.session = None
 
     def queue_prompt(self, prompt: Dict[str, Any]) -> str:
         """
@@ -63,16 +98,26 @@ class WorkflowExecutor:
             Prompt ID for tracking
         """
         p = {"prompt": prompt, "client_id": self.client_id}
-        data = json.dumps(p).encode('utf-8')
-
-        req = urllib.request.Request(
-            f"http://{self.server_address}/prompt",
-            data=data,
-            headers={'Content-Type': 'application/json'}
-        )
+        url = f"http://{self.server_address}/prompt"
+        # orjson emits UTF-8 bytes directly; the stdlib fallback emits compact
+        # ASCII-only JSON (ensure_ascii is the default), so the ASCII codec suffices
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(p)
+        else:
+            data = json.dumps(p, separators=(',', ':')).encode('ascii')
+        headers = {'Content-Type': 'application/json'}
+
+        session = self._http_session()
+        if session is not None:
+            response = session.post(url, data=data, headers=headers)
+            # Match urlopen, which raises HTTPError on 4xx/5xx
+            response.raise_for_status()
+            result = _json_loads(response.content)
+        else:
+            req = urllib.request.Request(url, data=data, headers=headers)
 
-        response = urllib.request.urlopen(req)
-        result = json.loads(response.read())
+            response = urllib.request.urlopen(req)
+            result = _json_loads(response.read())
 
         if 'prompt_id' not in result:
             raise RuntimeError(f"Failed to queue prompt: {result}")
@@ -93,27 +138,50 @@ class WorkflowExecutor:
         if not self.ws:
             raise RuntimeError("Not connected to websocket")
 
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                raise TimeoutError(f"Workflow execution timed out after {timeout}s")
-
-            out = self.ws.recv()
-
-            if isinstance(out, str):
-                message = json.loads(out)
-
-                if message['type'] == 'executing':
+        # recv() itself enforces the deadline, so a silent server can't block past the timeout
+        deadline = time.monotonic() + timeout
+        prompt_key = prompt_id.encode('utf-8')
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Workflow execution timed out after {timeout}s")
+                self.ws.settimeout(remaining)
+
+                try:
+                    opcode, out = self.ws.recv_data()
+                except websocket.WebSocketTimeoutException:
+                    raise TimeoutError(f"Workflow execution timed out after {timeout}s")
+
+                if opcode != websocket.ABNF.OPCODE_TEXT:
+                    # Binary frames are preview images
+                    continue
+
+                # Most messages are progress/status or per-node "executing" updates;
+                # only decode errors and the final "executing" frame for this prompt
+                # (node: null). Match quoted values alone, since the server's
+                # json.dumps puts a space after each colon
+                if b'"execution_error"' not in out:
+                    if b'"executing"' not in out or b'null' not in out or prompt_key not in out:
+                        continue
+
+                message = _json_loads(out)
+                msg_type = message.get('type')
+
+                if msg_type == 'executing':
                     data = message['data']
 
                     # When node is None and prompt_id matches, execution is done
                     if data['node'] is None and data['prompt_id'] == prompt_id:
                         return True
 
-                elif message['type'] == 'execution_error':
+                elif msg_type == 'execution_error':
                     error_data = message['data']
                     raise RuntimeError(f"Execution error: {error_data}")
+        finally:
+            if self.ws:
+                self.ws.settimeout(None)
 
     def get_history(self, prompt_id: str) -> Dict[str, Any]:
         """
@@ -127,8 +195,14 @@ class WorkflowExecutor:
         """
         url = f"http://{self.server_address}/history/{prompt_id}"
 
-        with urllib.request.urlopen(url) as response:
-            history = json.loads(response.read())
+        session = self._http_session()
+        if session is not None:
+            response = session.get(url)
+            response.raise_for_status()
+            history = _json_loads(response.content)
+        else:
+            with urllib.request.urlopen(url) as response:
+                history = _json_loads(response.read())
 
         if prompt_id not in history:
             raise RuntimeError(f"Prompt {prompt_id} not found in history")
@@ -181,9 +255,34 @@ class WorkflowExecutor:
         """
         from .workflow_converter import WorkflowConverter
 
-        # Load workflow
-        with open(workflow_path, 'r') as f:
-            workflow_json = json.load(f)
+        # Classify the format from the start of the file: API prompts are keyed by
+        # node id with a "class_type" per node, UI workflows open with a "nodes" array
+        with open(workflow_path, 'rb') as f:
+            head = f.read(4096)
+
+        if b'"class_type"' in head:
+            workflow = WorkflowConverter.load_workflow(workflow_path)
+        elif b'"nodes"' in head:
+            # Goes through the converter's in-process cache, keyed on path, mtime and size
+            workflow = WorkflowConverter.convert_workflow_file(workflow_path)
+        else:
+            # Inconclusive prefix: parse and inspect the whole document
+            return self.execute_workflow_dict(WorkflowConverter.load_workflow(workflow_path), timeout)
+
+        return self.execute_workflow(workflow, timeout)
+
+    def execute_workflow_dict(self, workflow_json: Dict[str, Any], timeout: int = 300) -> Dict[str, Any]:
+        """
+        Execute an already-parsed workflow.
+
+        Args:
+            workflow_json: Workflow dictionary (UI or API format)
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            Dictionary of outputs by node ID
+        """
+        from .workflow_converter import WorkflowConverter
 
         # Check if it's UI format (has 'nodes' array) or API format
         if 'nodes' in workflow_json:
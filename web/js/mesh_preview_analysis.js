@@ -363,9 +363,8 @@ app.registerExtension({
                         updateInfoPanel();
 
                         // Load mesh in viewer
-                        const filepath = `/view?filename=${encodeURIComponent(filename)}&type=output&subfolder=`;
-
-                        const sendMessage = () => {
+                        const sendMessage = (readyFilename) => {
+                            const filepath = `/view?filename=${encodeURIComponent(readyFilename)}&type=output&subfolder=`;
                             if (iframe.contentWindow) {
                                 iframe.contentWindow.postMessage({
                                     type: "LOAD_MESH",
@@ -375,11 +374,38 @@ app.registerExtension({
                             }
                         };
 
-                        if (iframeLoaded) {
-                            sendMessage();
-                        } else {
-                            setTimeout(sendMessage, 500);
-                        }
+                        // The preview file is written in the background; wait until it exists
+                        const waitForMesh = async () => {
+                            if (message.mesh_ready?.[0] !== false) {
+                                return filename;
+                            }
+                            while (node.meshId === meshId) {
+                                try {
+                                    const response = await fetch(`/geompack/mesh_ready?mesh_id=${encodeURIComponent(meshId)}`);
+                                    const result = await response.json();
+                                    if (!result.success || result.ready) {
+                                        return result.filename || filename;
+                                    }
+                                } catch (e) {
+                                    console.warn("[MeshAnalysis] mesh_ready check failed:", e);
+                                    return filename;
+                                }
+                                await new Promise(resolve => setTimeout(resolve, 200));
+                            }
+                            return null;
+                        };
+
+                        waitForMesh().then(readyFilename => {
+                            if (!readyFilename) {
+                                return;  // A newer execution replaced this mesh
+                            }
+                            node.meshFilename = readyFilename;
+                            if (iframeLoaded) {
+                                sendMessage(readyFilename);
+                            } else {
+                                setTimeout(() => sendMessage(readyFilename), 500);
+                            }
+                        });
                     }
                 };
 
@@ -205,8 +205,10 @@ app.registerExtension({
 
                         // Add watertight status (always shown)
                         if (message.is_watertight !== undefined) {
-                            const watertight = message.is_watertight[0] ? 'Yes' : 'No';
-                            const color = message.is_watertight[0] ? '#6c6' : '#c66';
+                            // null means the check was skipped for a very large mesh
+                            const known = message.is_watertight[0] !== null;
+                            const watertight = !known ? 'Unknown' : (message.is_watertight[0] ? 'Yes' : 'No');
+                            const color = !known ? '#888' : (message.is_watertight[0] ? '#6c6' : '#c66');
                             infoHTML += `
                                 <span style="color: #888;">Watertight:</span>
                                 <span style="color: ${color};">${watertight}</span>
@@ -258,11 +260,36 @@ app.registerExtension({
 
                         infoPanel.innerHTML = infoHTML;
 
-                        // ComfyUI serves output files via /view API endpoint
-                        const filepath = `/view?filename=${encodeURIComponent(filename)}&type=output&subfolder=`;
+                        // The preview file may still be written in the background; wait until it exists
+                        this.previewFilename = filename;
+                        const waitForFile = async () => {
+                            if (!message.mesh_pending?.[0]) {
+                                return filename;
+                            }
+                            while (this.previewFilename === filename) {
+                                try {
+                                    const response = await fetch(`/geompack/preview_ready?filename=${encodeURIComponent(filename)}`);
+                                    const result = await response.json();
+                                    if (!result.success || result.ready) {
+                                        return result.filename || filename;
+                                    }
+                                } catch (e) {
+                                    console.warn("[GeomPack VTK] preview_ready check failed:", e);
+                                    return filename;
+                                }
+                                await new Promise(resolve => setTimeout(resolve, 200));
+                            }
+                            return null;
+                        };
 
                         // Function to send message
-                        const sendMessage = () => {
+                        const sendMessage = async () => {
+                            const readyFilename = await waitForFile();
+                            if (!readyFilename) {
+                                return;  // A newer execution replaced this preview
+                            }
+                            // ComfyUI serves output files via /view API endpoint
+                            const filepath = `/view?filename=${encodeURIComponent(readyFilename)}&type=output&subfolder=`;
                             if (iframe.contentWindow) {
                                 iframe.contentWindow.postMessage({
                                     type: "LOAD_MESH",